@@ -15,6 +15,7 @@ import csv
 import os
 from pathlib import Path
 from datetime import datetime
+from itertools import chain
 import re
 
 def parse_date(date_str):
@@ -74,10 +75,35 @@ def get_next_filename(export_folder, base_name):
             return filepath
         counter += 1
 
-def read_csv_file(file_path):
-    """Read CSV file and return headers and rows."""
+def scan_csv_rows(reader, headers, date_col_resolver):
+    """Collect the data rows and track the oldest date in the same pass."""
+    rows = []
+    oldest_date = None
+    
+    first_row = next(reader, None)
+    if first_row is None:
+        return rows, oldest_date
+    
+    date_column_index = date_col_resolver(headers, first_row)
+    
+    for row in chain((first_row,), reader):
+        rows.append(row)
+        if date_column_index is not None and date_column_index < len(row):
+            parsed_date = parse_date(row[date_column_index])
+            if parsed_date and (oldest_date is None or parsed_date < oldest_date):
+                oldest_date = parsed_date
+    
+    return rows, oldest_date
+
+def read_csv_file_with_date(file_path, date_col_resolver):
+    """Read CSV file and return headers, rows and the oldest date found.
+    
+    date_col_resolver(headers, first_row) returns the index of the date
+    column, or None to skip date detection.
+    """
     rows = []
     headers = []
+    oldest_date = None
     
     # Common delimiters to try
     delimiters = [',', ';', '\t', '|']
@@ -88,11 +114,11 @@ def read_csv_file(file_path):
                 with open(file_path, 'r', encoding=encoding, newline='') as csvfile:
                     reader = csv.reader(csvfile, delimiter=delimiter)
                     headers = next(reader)  # First row as headers
-                    rows = list(reader)
                     
                     # Check if this seems like a valid CSV (headers should have multiple columns)
                     if len(headers) > 1:
-                        return headers, rows
+                        rows, oldest_date = scan_csv_rows(reader, headers, date_col_resolver)
+                        return headers, rows, oldest_date
                         
             except (UnicodeDecodeError, StopIteration, csv.Error):
                 continue
@@ -109,12 +135,12 @@ def read_csv_file(file_path):
             
             reader = csv.reader(csvfile, delimiter=delimiter)
             headers = next(reader)
-            rows = list(reader)
+            rows, oldest_date = scan_csv_rows(reader, headers, date_col_resolver)
             
     except Exception as e:
         raise Exception(f"Could not read CSV file: {str(e)}")
     
-    return headers, rows
+    return headers, rows, oldest_date
 
 def main():
     print("=" * 80)
@@ -152,11 +178,18 @@ def main():
     file_data = []  # List to store (file_info, headers, rows) tuples
     common_headers = None
     total_rows = 0
+    date_column = {}
+    
+    def resolve_date_column(headers, first_row):
+        # Find date column from first file, reuse it for the rest
+        if 'index' not in date_column:
+            date_column['index'] = find_date_column(headers, first_row)
+        return date_column['index']
     
     for csv_file in csv_files:
         try:
             print(f"📖 Reading: {csv_file.name}")
-            headers, rows = read_csv_file(csv_file)
+            headers, rows, oldest_date = read_csv_file_with_date(csv_file, resolve_date_column)
             
             if not rows:
                 print(f"   ⚠️  File is empty, skipping...")
@@ -165,20 +198,10 @@ def main():
             # Set headers from first file
             if common_headers is None:
                 common_headers = headers
-                # Find date column from first file
-                date_column_index = find_date_column(headers, rows[0] if rows else [])
+                date_column_index = date_column.get('index')
                 if date_column_index is not None:
                     print(f"   📅 Found date column: '{headers[date_column_index]}' (column {date_column_index + 1})")
             
-            # Find the oldest date in this file for sorting files
-            oldest_date = None
-            for row in rows:
-                if date_column_index is not None and date_column_index < len(row):
-                    parsed_date = parse_date(row[date_column_index])
-                    if parsed_date:
-                        if oldest_date is None or parsed_date < oldest_date:
-                            oldest_date = parsed_date
-            
             # Store file data with its oldest date for sorting
             file_data.append({
                 'filename': csv_file.name,
@@ -16,9 +16,18 @@ import sys
 import shutil
 from pathlib import Path
 import re
+from collections import namedtuple
 from datetime import datetime
 import PyPDF2
 
+# Currency codes that may appear in OTP amount cells
+CURRENCY_CODES = ('ALL', 'EUR', 'USD')
+CURRENCY_PATTERN = re.compile(r'\s*(ALL|EUR|USD)\s*')
+NON_NUMERIC_PATTERN = re.compile(r'[^\d.]')
+
+# One transaction; field order matches the QuickBooks CSV columns
+Txn = namedtuple('Txn', 'Date Description Amount Type')
+
 def read_csv_file(csv_path):
     """Read CSV file and return headers and rows."""
     try:
@@ -43,10 +52,8 @@ def extract_text_from_pdf(pdf_path):
     try:
         with open(pdf_path, 'rb') as file:
             pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text += page.extract_text() + "\n"
+            # Join once instead of growing the string page by page
+            text = "".join(page.extract_text() + "\n" for page in pdf_reader.pages)
         return text
     except Exception as e:
         print(f"Error reading PDF: {str(e)}")
@@ -74,8 +81,11 @@ def clean_amount(amount_str):
     if not amount_str:
         return ""
     
-    # Remove currency codes like "ALL", "EUR", "USD"
-    amount = re.sub(r'\s*(ALL|EUR|USD)\s*', '', amount_str)
+    # Remove currency codes like "ALL", "EUR", "USD" (most cells have none)
+    if any(code in amount_str for code in CURRENCY_CODES):
+        amount = CURRENCY_PATTERN.sub('', amount_str)
+    else:
+        amount = amount_str
     
     # Remove any leading/trailing whitespace
     amount = amount.strip()
@@ -114,7 +124,8 @@ def clean_amount(amount_str):
             amount = amount.replace(',', '')
     
     # Remove any remaining non-numeric characters except decimal point
-    amount = re.sub(r'[^\d.]', '', amount)
+    if not amount.replace('.', '').isdecimal():
+        amount = NON_NUMERIC_PATTERN.sub('', amount)
     
     try:
         # Validate it's a proper number
@@ -210,13 +221,7 @@ def extract_transactions_from_pdf_text(text):
                     clean_amount_val = '-' + clean_amount(amount_str)
                     
                     if description and clean_amount_val:
-                        transaction = {
-                            'Date': qb_date,
-                            'Description': description,
-                            'Amount': clean_amount_val,
-                            'Type': 'Debit'
-                        }
-                        transactions.append(transaction)
+                        transactions.append(Txn(qb_date, description, clean_amount_val, 'Debit'))
                         
             except Exception as e:
                 continue
@@ -387,13 +392,7 @@ def convert_to_quickbooks(output_directory=None):
                             
                             description = " - ".join(description_parts).strip(' -')
                             
-                            transaction = {
-                                'Date': qb_date,
-                                'Description': description,
-                                'Amount': amount,
-                                'Type': transaction_type
-                            }
-                            csv_transactions.append(transaction)
+                            csv_transactions.append(Txn(qb_date, description, amount, transaction_type))
                             processed_count += 1
                             
                     except Exception as e:
@@ -407,14 +406,14 @@ def convert_to_quickbooks(output_directory=None):
     
     if pdf_transactions:
         # Sort PDF transactions by date
-        pdf_transactions.sort(key=lambda x: datetime.strptime(x['Date'], '%d/%m/%Y'))
+        pdf_transactions.sort(key=lambda x: datetime.strptime(x.Date, '%d/%m/%Y'))
         # Generate PDF QuickBooks CSV using PDF filename
         pdf_output = generate_quickbooks_csv(pdf_transactions, pdf_filename, "", output_directory)
         output_files.append(f"📄 PDF: {pdf_output}")
     
     if csv_transactions:
         # Sort CSV transactions by date
-        csv_transactions.sort(key=lambda x: datetime.strptime(x['Date'], '%d/%m/%Y'))
+        csv_transactions.sort(key=lambda x: datetime.strptime(x.Date, '%d/%m/%Y'))
         # Generate CSV QuickBooks CSV using CSV filename
         csv_output = generate_quickbooks_csv(csv_transactions, csv_filename, "", output_directory)
         output_files.append(f"CSV: {csv_output}")
@@ -462,14 +461,7 @@ def generate_quickbooks_csv(transactions, original_filename, source_type, output
         with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(headers)
-            
-            for transaction in transactions:
-                writer.writerow([
-                    transaction['Date'],
-                    transaction['Description'],
-                    transaction['Amount'],
-                    transaction['Type']
-                ])
+            writer.writerows(transactions)
         
         return str(output_file)
     except Exception as e:
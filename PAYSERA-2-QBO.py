@@ -23,16 +23,66 @@ import csv
 import sys
 import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 import re
 import argparse
-try:
-    import PyPDF2
-    PDF_SUPPORT = True
-except ImportError:
-    PDF_SUPPORT = False
-    print("Warning: PyPDF2 not installed. PDF support disabled.")
+import traceback
+from collections import namedtuple
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor
+import importlib.util
 
+# The PDF libraries are imported on first use (see get_pdf_backend), so
+# CSV conversions don't pay for loading them; only check they are installed
+PDF_SUPPORT = any(importlib.util.find_spec(name) is not None for name in ('pymupdf', 'fitz', 'PyPDF2'))
+if not PDF_SUPPORT:
+    print("Warning: PyMuPDF/PyPDF2 not installed. PDF support disabled.")
+
+# PyPDF2 is the default PDF library; setting this variable (done by --pymupdf)
+# opts in to PyMuPDF. Worker processes inherit it through the environment.
+PYMUPDF_ENV_VAR = 'QBO_USE_PYMUPDF'
+
+# Full tracebacks for parse errors only when PAYSERA_DEBUG is set
+DEBUG = bool(os.environ.get('PAYSERA_DEBUG'))
+
+# Compiled once; these run for every CSV row / PDF line
+CURRENCY_PATTERN = re.compile(r'\s*[A-Z]{3}$')
+EUR_AMOUNT_PATTERN = re.compile(r'(-?\d+\.\d{2})\s*EUR')
+LONG_NUMBER_PATTERN = re.compile(r'\d{10,}')
+ACCOUNT_REF_PATTERN = re.compile(r'EVP\d+|[A-Z]{2}\d{2}')
+
+# Lines that open a transaction block in the PDF text
+PDF_TRANSACTION_TYPES = frozenset({'Transfer', 'Commission fee', 'Payment', 'Withdrawal'})
+_PDF_TYPE_ALTERNATION = '|'.join(re.escape(t) for t in sorted(PDF_TRANSACTION_TYPES))
+
+# One PDF transaction block: a type line, a date line, then everything up to
+# the next type line (or the end of the text)
+PDF_TRANSACTION_PATTERN = re.compile(
+    rf'^[ \t]*(?P<type>{_PDF_TYPE_ALTERNATION})[ \t]*\n'
+    r'(?P<date>[^\n]*)\n?'
+    r'(?P<body>.*?)'
+    rf'(?=^[ \t]*(?:{_PDF_TYPE_ALTERNATION})[ \t]*$|\Z)',
+    re.DOTALL | re.MULTILINE
+)
+# Number of lines after the date line scanned for amount, recipient and purpose
+PDF_BLOCK_LINES = 14
+
+# One transaction; field order matches the QuickBooks CSV columns
+Txn = namedtuple('Txn', 'Date Description Debit Credit Balance')
+QUICKBOOKS_HEADER = ['Date', 'Description', 'Debit', 'Credit', 'Balance']
+
+# Buffer size for reading input and writing output CSV files (1 MB)
+IO_BUFFER_SIZE = 1 << 20
+
+# Give up claiming an output filename after this many collisions
+MAX_OUTPUT_NAME_ATTEMPTS = 100
+
+# CSV files larger than this use the pandas engine when --engine is auto;
+# smaller files are faster through the streaming parser (no pandas import)
+PANDAS_MIN_CSV_SIZE = 256 * 1024
+
+@lru_cache(maxsize=8192)
 def parse_paysera_amount(amount_str):
     """
     Parse Paysera amount format to float.
@@ -44,12 +94,18 @@ def parse_paysera_amount(amount_str):
     Returns:
         float: Parsed amount
     """
-    if not amount_str or amount_str.strip() == '0.00':
+    amount_str = amount_str.strip()
+    if not amount_str or amount_str == '0.00':
         return 0.0
     
-    # Remove any spaces and currency codes
-    amount_str = amount_str.strip()
-    amount_str = re.sub(r'[A-Z]{3}$', '', amount_str).strip()  # Remove currency code
+    # Callers usually pass a bare number already; only fall back to the
+    # currency-code regex when that fails
+    try:
+        return float(amount_str)
+    except ValueError:
+        pass
+    
+    amount_str = CURRENCY_PATTERN.sub('', amount_str).strip()  # Remove currency code
     
     try:
         return float(amount_str)
@@ -57,6 +113,19 @@ def parse_paysera_amount(amount_str):
         print(f"Warning: Could not parse amount '{amount_str}', using 0.0")
         return 0.0
 
+def strip_currency_code(value):
+    """
+    Drop a trailing " EUR"-style currency code from an amount cell.
+    
+    Cells without a space-separated code are returned unchanged;
+    parse_paysera_amount still strips codes glued to the number.
+    """
+    head, sep, tail = value.rpartition(' ')
+    if sep and len(tail) == 3 and tail.isalpha() and tail.isupper():
+        return head
+    return value
+
+@lru_cache(maxsize=4096)
 def parse_paysera_date(date_str):
     """
     Parse Paysera date format to ISO format.
@@ -70,41 +139,41 @@ def parse_paysera_date(date_str):
     Returns:
         str: Date in YYYY-MM-DD format
     """
+    # Zero-padded dates already start with YYYY-MM-DD, so validate and slice
+    # them instead of round-tripping through strptime/strftime
+    s = date_str.strip()
+    if (len(s) >= 10 and s[4] == '-' and s[7] == '-'
+            and s[:4].isdigit() and s[5:7].isdigit() and s[8:10].isdigit()):
+        return s[:10]
+    
     try:
-        # Try parsing full datetime format first
+        # Anything else (e.g. unpadded "2025-1-2") goes through strptime
         if ' ' in date_str:
             date_obj = datetime.strptime(date_str.split('+')[0].strip(), '%Y-%m-%d %H:%M:%S')
         else:
-            date_obj = datetime.strptime(date_str.strip(), '%Y-%m-%d')
+            date_obj = datetime.strptime(s, '%Y-%m-%d')
         return date_obj.strftime('%Y-%m-%d')
     except ValueError:
         print(f"Warning: Could not parse date '{date_str}'")
         return date_str.split()[0] if ' ' in date_str else date_str
 
-def extract_description(row):
+@lru_cache(maxsize=2048)
+def extract_description(trans_type, recipient, purpose):
     """
-    Extract and clean transaction description from Paysera row.
+    Build a clean transaction description from Paysera row fields.
     
     Combines Type, Recipient/Payer, and Purpose of payment fields.
     
     Args:
-        row: Dictionary containing transaction data
+        trans_type: Value of the Type column
+        recipient: Value of the Recipient / Payer column
+        purpose: Value of the Purpose of payment column
         
     Returns:
         str: Clean description
     """
-    trans_type = row.get('Type', '').strip()
-    recipient = row.get('Recipient / Payer', '').strip()
-    purpose = row.get('Purpose of payment', '').strip()
-    
-    # Combine fields
-    parts = []
-    if trans_type:
-        parts.append(trans_type)
-    if recipient:
-        parts.append(recipient)
-    if purpose:
-        parts.append(purpose)
+    # Combine non-empty fields
+    parts = [part for part in (trans_type.strip(), recipient.strip(), purpose.strip()) if part]
     
     full_desc = ' - '.join(parts) if parts else "Transaction"
     
@@ -113,88 +182,218 @@ def extract_description(row):
     
     return full_desc
 
-def parse_paysera_csv(csv_path):
+def iter_paysera_csv(csv_path):
     """
-    Parse Paysera CSV file and extract transactions.
+    Stream transactions from a Paysera CSV file one row at a time.
+    
+    Parse errors propagate to the caller.
+    
+    Args:
+        csv_path: Path to the CSV file
+        
+    Yields:
+        Txn: One transaction per data row
+    """
+    count = 0
+    
+    with open(csv_path, 'r', encoding='utf-8-sig', buffering=IO_BUFFER_SIZE) as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        
+        # Resolve column positions once; a column missing from the header
+        # points at the empty cell appended to every row below
+        n_columns = len(header)
+        columns = {name: i for i, name in enumerate(header)}
+        i_date = columns.get('Date and time', n_columns)
+        i_amount = columns.get('Amount and currency', n_columns)
+        i_balance = columns.get('Balance', n_columns)
+        i_type = columns.get('Type', n_columns)
+        i_recipient = columns.get('Recipient / Payer', n_columns)
+        i_purpose = columns.get('Purpose of payment', n_columns)
+        
+        for row in reader:
+            if len(row) != n_columns:
+                row = (row + [''] * n_columns)[:n_columns]
+            row.append('')
+            
+            # Skip empty rows
+            date_str = row[i_date]
+            if not date_str:
+                continue
+            
+            # Parse amount
+            amount_str = row[i_amount]
+            # Remove currency code if present
+            amount_str = strip_currency_code(amount_str)
+            amount = parse_paysera_amount(amount_str)
+            
+            # Determine debit or credit based on amount sign
+            debit = abs(amount) if amount < 0 else 0
+            credit = amount if amount > 0 else 0
+            
+            # Parse balance
+            balance_str = row[i_balance]
+            balance_str = strip_currency_code(balance_str)
+            balance = parse_paysera_amount(balance_str)
+            
+            # Parse date
+            date = parse_paysera_date(date_str)
+            
+            # Extract description
+            description = extract_description(row[i_type], row[i_recipient], row[i_purpose])
+            
+            # Balance is stored positive
+            count += 1
+            yield Txn(date, description, debit, credit, abs(balance))
+    
+    print(f"Successfully parsed {count} transactions from CSV")
+
+def stream_paysera_csv(csv_path):
+    """
+    Open a Paysera CSV file as a lazy stream of transactions.
+    
+    Reads the first row up front so empty or unreadable files can be
+    reported before an output file is created.
     
     Args:
         csv_path: Path to the CSV file
         
     Returns:
-        list: List of transaction dictionaries
+        Iterable of Txn records, or an empty list if there are none
     """
-    transactions = []
+    transactions = iter_paysera_csv(csv_path)
+    try:
+        first = next(transactions, None)
+    except Exception as e:
+        print(f"Error parsing CSV: {e}")
+        return []
+    return chain((first,), transactions) if first is not None else []
+
+def parse_paysera_csv_pandas(csv_path):
+    """
+    Parse Paysera CSV file with pandas, using column operations instead of a row loop.
+    
+    Produces the same records as iter_paysera_csv and falls back to the
+    streaming parser when pandas rejects the file (e.g. ragged rows).
+    
+    Args:
+        csv_path: Path to the CSV file
+        
+    Returns:
+        List of Txn records, or the stream_paysera_csv result on fallback
+        
+    Raises:
+        ImportError: If pandas is not installed
+    """
+    import pandas as pd  # Imported here so the pure-Python path never pays for it
     
     try:
-        with open(csv_path, 'r', encoding='utf-8-sig') as file:
-            reader = csv.DictReader(file)
-            
-            for row in reader:
-                # Skip empty rows
-                if not row.get('Date and time'):
-                    continue
-                
-                # Parse amount
-                amount_str = row.get('Amount and currency', '0')
-                # Remove currency code if present
-                amount_str = re.sub(r'\s*[A-Z]{3}$', '', amount_str)
-                amount = parse_paysera_amount(amount_str)
-                
-                # Determine debit or credit based on amount sign
-                debit = abs(amount) if amount < 0 else 0
-                credit = amount if amount > 0 else 0
-                
-                # Parse balance
-                balance_str = row.get('Balance', '0')
-                balance_str = re.sub(r'\s*[A-Z]{3}$', '', balance_str)
-                balance = parse_paysera_amount(balance_str)
-                
-                # Parse date
-                date = parse_paysera_date(row.get('Date and time', ''))
-                
-                # Extract description
-                description = extract_description(row)
-                
-                transaction = {
-                    'Date': date,
-                    'Description': description,
-                    'Debit': debit,
-                    'Credit': credit,
-                    'Balance': abs(balance)  # Ensure positive balance
-                }
-                
-                transactions.append(transaction)
+        df = pd.read_csv(csv_path, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+        
+        def column(name):
+            if name in df.columns:
+                return df[name].fillna('')
+            return pd.Series('', index=df.index)
+        
+        # Skip empty rows
+        df = df[column('Date and time') != '']
+        
+        def amounts(name):
+            values = column(name).str.strip().str.replace(r'\s*[A-Z]{3}$', '', regex=True).str.strip()
+            numbers = pd.to_numeric(values, errors='coerce')
+            # Hand whatever pandas could not read to the scalar parser, which
+            # warns about it just like the streaming path
+            unparsed = numbers.isna() & (values != '')
+            if unparsed.any():
+                numbers[unparsed] = values[unparsed].map(parse_paysera_amount)
+            return numbers.fillna(0.0)
+        
+        # Determine debit or credit based on amount sign
+        amount = amounts('Amount and currency')
+        debit = (-amount).clip(lower=0)
+        credit = amount.clip(lower=0)
+        balance = amounts('Balance').abs()
+        
+        # Dates and descriptions repeat heavily; the cached helpers handle them
+        dates = column('Date and time').map(parse_paysera_date)
+        descriptions = map(
+            extract_description,
+            column('Type').tolist(),
+            column('Recipient / Payer').tolist(),
+            column('Purpose of payment').tolist()
+        )
+        
+        transactions = list(map(
+            Txn._make,
+            zip(dates.tolist(), descriptions, debit.tolist(), credit.tolist(), balance.tolist())
+        ))
         
         print(f"Successfully parsed {len(transactions)} transactions from CSV")
         return transactions
         
     except Exception as e:
-        print(f"Error parsing CSV: {e}")
-        import traceback
-        traceback.print_exc()
-        return []
+        print(f"Warning: pandas could not parse CSV ({e}), using the Python CSV parser")
+        if DEBUG:
+            traceback.print_exc()
+        return stream_paysera_csv(csv_path)
+
+@lru_cache(maxsize=None)
+def get_pdf_backend():
+    """
+    Import the PDF library on first use.
+    
+    PyPDF2 is the default. PyMuPDF (C-backed text extraction) is used
+    instead when opted in through PYMUPDF_ENV_VAR and installed.
+    
+    Returns:
+        tuple: (name, module) with name 'pymupdf' or 'pypdf2', or None if
+        no usable library can be imported
+    """
+    if os.environ.get(PYMUPDF_ENV_VAR):
+        try:
+            import pymupdf as fitz
+            return 'pymupdf', fitz
+        except ImportError:
+            pass
+        try:
+            import fitz  # PyMuPDF releases before the pymupdf module name
+            return 'pymupdf', fitz
+        except ImportError:
+            print("Warning: PyMuPDF not installed, using PyPDF2")
+    try:
+        import PyPDF2
+        return 'pypdf2', PyPDF2
+    except ImportError:
+        return None
 
 def extract_text_from_pdf(pdf_path):
     """
     Extract text content from Paysera PDF file.
     
+    Uses PyPDF2, or PyMuPDF when opted in with --pymupdf.
+    
     Args:
         pdf_path: Path to the PDF file
         
     Returns:
         str: Extracted text content
     """
-    if not PDF_SUPPORT:
-        print("Error: PyPDF2 not installed. Cannot process PDF files.")
+    backend = get_pdf_backend()
+    if backend is None:
+        print("Error: PyPDF2 not installed (or use --pymupdf with PyMuPDF). Cannot process PDF files.")
         return ""
+    backend_name, pdf_module = backend
     
     try:
+        if backend_name == 'pymupdf':
+            with pdf_module.open(pdf_path) as doc:
+                return '\n'.join(page.get_text() for page in doc)
+        
         with open(pdf_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text()
-            return text
+            reader = pdf_module.PdfReader(file)
+            # Join once instead of growing a string page by page; the newline
+            # keeps a page's last line from running into the next page's first
+            return '\n'.join(page.extract_text() for page in reader.pages)
     except Exception as e:
         print(f"Error extracting PDF text: {e}")
         return ""
@@ -210,7 +409,7 @@ def parse_paysera_pdf(pdf_path):
         pdf_path: Path to the PDF file
         
     Returns:
-        list: List of transaction dictionaries
+        list: List of Txn records
     """
     transactions = []
     text = extract_text_from_pdf(pdf_path)
@@ -219,139 +418,106 @@ def parse_paysera_pdf(pdf_path):
         return transactions
     
     try:
-        lines = text.split('\n')
-        
         # Transaction pattern: Type, Date, Statement No, Payment ID, Recipient, Account, Amount, Balance
-        # Look for transaction blocks
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Check if line starts with transaction type
-            if line in ['Transfer', 'Commission fee', 'Payment', 'Withdrawal']:
-                try:
-                    trans_type = line
-                    
-                    # Next line should have date and time
-                    i += 1
-                    if i >= len(lines):
-                        break
-                    date_line = lines[i].strip()
+        # Each match is one transaction block, from its type line up to the next one
+        for match in PDF_TRANSACTION_PATTERN.finditer(text):
+            try:
+                trans_type = match.group('type')
+                date_line = match.group('date').strip()
+                
+                # Parse date
+                date = parse_paysera_date(date_line)
+                
+                # Only the first lines of a block belong to the transaction
+                body_lines = match.group('body').split('\n')[:PDF_BLOCK_LINES]
+                
+                amount_str = ""
+                balance_str = ""
+                recipient = ""
+                purpose = ""
+                for next_line in body_lines:
+                    next_line = next_line.strip()
                     
-                    # Parse date
-                    date = parse_paysera_date(date_line)
+                    # First line with an EUR amount has the transaction amount,
+                    # the second one the balance
+                    if not balance_str:
+                        amount_match = EUR_AMOUNT_PATTERN.search(next_line)
+                        if amount_match:
+                            if not amount_str:
+                                amount_str = amount_match.group(1)
+                            else:
+                                balance_str = amount_match.group(1)
                     
-                    # Look ahead for amount (contains EUR or other currency)
-                    amount_str = ""
-                    balance_str = ""
-                    recipient = ""
-                    purpose = ""
+                    # Look for recipient/payer
+                    if not recipient and next_line and not LONG_NUMBER_PATTERN.search(next_line) and 'Purpose of payment' not in next_line:
+                        # Skip statement numbers and payment IDs
+                        if not next_line.isdigit() and len(next_line) > 3 and next_line != 'EUR' and next_line != date_line:
+                            if not ACCOUNT_REF_PATTERN.search(next_line):
+                                recipient = next_line
                     
-                    # Scan next several lines for amount and balance
-                    j = i + 1
-                    found_amount = False
-                    found_balance = False
+                    # Look for purpose
+                    if 'Purpose of payment' in next_line:
+                        purpose_line = next_line.replace('Purpose of payment', '').strip()
+                        if purpose_line.startswith(':'):
+                            purpose_line = purpose_line[1:].strip()
+                        if purpose_line:
+                            purpose = purpose_line
+                
+                # Parse amount and balance
+                if amount_str:
+                    amount = parse_paysera_amount(amount_str)
+                    balance = parse_paysera_amount(balance_str) if balance_str else 0
                     
-                    while j < len(lines) and j < i + 15:
-                        next_line = lines[j].strip()
-                        
-                        # Check if this is a new transaction type
-                        if next_line in ['Transfer', 'Commission fee', 'Payment', 'Withdrawal']:
-                            break
-                        
-                        # Look for amount pattern (number with EUR)
-                        if re.search(r'-?\d+\.\d{2}\s*EUR', next_line):
-                            if not found_amount:
-                                amount_match = re.search(r'(-?\d+\.\d{2})\s*EUR', next_line)
-                                if amount_match:
-                                    amount_str = amount_match.group(1)
-                                    found_amount = True
-                            elif not found_balance:
-                                balance_match = re.search(r'(-?\d+\.\d{2})\s*EUR', next_line)
-                                if balance_match:
-                                    balance_str = balance_match.group(1)
-                                    found_balance = True
-                        
-                        # Look for recipient/payer
-                        if not recipient and next_line and not re.search(r'\d{10,}', next_line) and 'Purpose of payment' not in next_line:
-                            # Skip statement numbers and payment IDs
-                            if not next_line.isdigit() and len(next_line) > 3 and next_line not in ['EUR', date_line]:
-                                if not re.search(r'EVP\d+|[A-Z]{2}\d{2}', next_line):
-                                    recipient = next_line
-                        
-                        # Look for purpose
-                        if 'Purpose of payment' in next_line:
-                            purpose_line = next_line.replace('Purpose of payment', '').strip()
-                            if purpose_line.startswith(':'):
-                                purpose_line = purpose_line[1:].strip()
-                            if purpose_line:
-                                purpose = purpose_line
-                        
-                        j += 1
+                    # Determine debit or credit
+                    debit = abs(amount) if amount < 0 else 0
+                    credit = amount if amount > 0 else 0
                     
-                    # Parse amount and balance
-                    if amount_str:
-                        amount = parse_paysera_amount(amount_str)
-                        balance = parse_paysera_amount(balance_str) if balance_str else 0
-                        
-                        # Determine debit or credit
-                        debit = abs(amount) if amount < 0 else 0
-                        credit = amount if amount > 0 else 0
-                        
-                        # Build description
-                        desc_parts = [trans_type]
-                        if recipient:
-                            desc_parts.append(recipient)
-                        if purpose:
-                            desc_parts.append(purpose)
-                        description = ' - '.join(desc_parts)
-                        
-                        transaction = {
-                            'Date': date,
-                            'Description': description,
-                            'Debit': debit,
-                            'Credit': credit,
-                            'Balance': abs(balance)
-                        }
-                        
-                        transactions.append(transaction)
+                    # Build description
+                    desc_parts = [trans_type]
+                    if recipient:
+                        desc_parts.append(recipient)
+                    if purpose:
+                        desc_parts.append(purpose)
+                    description = ' - '.join(desc_parts)
                     
-                    i = j
-                except Exception as e:
-                    print(f"Error parsing transaction at line {i}: {e}")
-                    i += 1
-            else:
-                i += 1
+                    transactions.append(Txn(date, description, debit, credit, abs(balance)))
+            except Exception as e:
+                print(f"Error parsing transaction at offset {match.start()}: {e}")
         
         print(f"Successfully parsed {len(transactions)} transactions from PDF")
         return transactions
         
     except Exception as e:
         print(f"Error parsing PDF: {e}")
-        import traceback
-        traceback.print_exc()
+        if DEBUG:
+            traceback.print_exc()
         return []
 
-def get_versioned_filename(file_path):
+def get_versioned_filename(file_path, taken=()):
     """
     Generate a versioned filename to avoid overwriting existing files.
     
     Args:
         file_path: Original file path
+        taken: File names to treat as used even if they are not listed on disk
         
     Returns:
         Path: New file path with version suffix if needed
     """
     path = Path(file_path)
-    if not path.exists():
+    taken = {os.path.normcase(name) for name in taken}
+    if os.path.normcase(path.name) not in taken and not path.exists():
         return path
     
+    # List the directory once instead of a stat() call per candidate version
+    existing = {os.path.normcase(entry.name) for entry in os.scandir(path.parent)}
+    existing |= taken
+    
     counter = 1
     while True:
         new_name = f"{path.stem} (v.{counter}){path.suffix}"
-        new_path = path.parent / new_name
-        if not new_path.exists():
-            return new_path
+        if os.path.normcase(new_name) not in existing:
+            return path.parent / new_name
         counter += 1
 
 def write_quickbooks_csv(transactions, output_path):
@@ -359,7 +525,7 @@ def write_quickbooks_csv(transactions, output_path):
     Write transactions to QuickBooks-compatible CSV format.
     
     Args:
-        transactions: List of transaction dictionaries
+        transactions: Iterable of Txn records (may be a generator)
         output_path: Path for output CSV file
         
     Returns:
@@ -369,33 +535,119 @@ def write_quickbooks_csv(transactions, output_path):
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Get versioned filename
-    output_path = get_versioned_filename(output_path)
-    
+    created = False
     try:
-        with open(output_path, 'w', newline='', encoding='utf-8') as file:
+        # Claim a versioned filename; another worker may take the same name
+        # between the check and the open, in which case pick the next one
+        requested_path = output_path
+        taken = set()
+        for _ in range(MAX_OUTPUT_NAME_ATTEMPTS):
+            output_path = get_versioned_filename(requested_path, taken)
+            try:
+                file = open(output_path, 'x', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE)
+                created = True
+                break
+            except FileExistsError:
+                # Move past the name that collided even if the directory
+                # listing does not show it (dangling symlink, case folding)
+                taken.add(output_path.name)
+        else:
+            raise FileExistsError(f"No free output filename for {requested_path}")
+        
+        with file:
             writer = csv.writer(file)
             
             # Write header
-            writer.writerow(['Date', 'Description', 'Debit', 'Credit', 'Balance'])
+            writer.writerow(QUICKBOOKS_HEADER)
             
-            # Write transactions
-            for trans in transactions:
-                writer.writerow([
-                    trans['Date'],
-                    trans['Description'],
-                    f"{trans['Debit']:.2f}" if trans['Debit'] > 0 else '',
-                    f"{trans['Credit']:.2f}" if trans['Credit'] > 0 else '',
-                    f"{trans['Balance']:.2f}"
-                ])
+            # Write transactions; zero debit/credit cells stay empty
+            writer.writerows(
+                (
+                    date,
+                    description,
+                    f"{debit:.2f}" if debit > 0 else '',
+                    f"{credit:.2f}" if credit > 0 else '',
+                    f"{balance:.2f}"
+                )
+                for date, description, debit, credit, balance in transactions
+            )
         
         print(f"✓ QuickBooks CSV created: {output_path}")
         return str(output_path)
         
     except Exception as e:
         print(f"Error writing CSV: {e}")
+        # Don't leave a half-written file behind when a streamed input fails
+        if created:
+            output_path.unlink(missing_ok=True)
         return None
 
+def process_file(input_file, output_dir, engine='auto'):
+    """
+    Convert one Paysera CSV or PDF file to a QuickBooks CSV.
+    
+    Args:
+        input_file: Path to the input file
+        output_dir: Directory for the output CSV
+        engine: CSV parser to use: 'pandas', 'python' or 'auto' (by file size)
+        
+    Returns:
+        bool: True if an output file was written
+    """
+    input_path = Path(input_file)
+    
+    if not input_path.exists():
+        print(f"Error: File not found: {input_path}")
+        return False
+    
+    print(f"\nProcessing: {input_path.name}")
+    print("=" * 60)
+    
+    # Determine file type and parse accordingly
+    file_extension = input_path.suffix.lower()
+    
+    if file_extension == '.pdf':
+        if not PDF_SUPPORT:
+            print(f"Error: PDF support not available. Install PyMuPDF or PyPDF2 to process PDF files.")
+            return False
+        print("File type: PDF")
+        transactions = parse_paysera_pdf(input_path)
+    elif file_extension == '.csv':
+        print("File type: CSV")
+        use_pandas = engine == 'pandas' or (
+            engine == 'auto' and input_path.stat().st_size > PANDAS_MIN_CSV_SIZE
+        )
+        transactions = None
+        if use_pandas:
+            try:
+                transactions = parse_paysera_csv_pandas(input_path)
+            except ImportError:
+                print("Warning: pandas not installed, using the Python CSV parser")
+        if transactions is None:
+            # Stream rows straight into the writer
+            transactions = stream_paysera_csv(input_path)
+    else:
+        print(f"Error: Unsupported file type: {file_extension}")
+        return False
+    
+    if not transactions:
+        print(f"No transactions found in {input_path.name}")
+        return False
+    
+    # Generate output filename
+    output_filename = f"{input_path.stem} - 4qbo.csv"
+    output_path = Path(output_dir) / output_filename
+    
+    # Write QuickBooks CSV
+    result = write_quickbooks_csv(transactions, output_path)
+    
+    if result:
+        print(f"✓ Converted: {input_path.name} -> {Path(result).name}")
+        return True
+    
+    print(f"✗ Failed to convert: {input_path.name}")
+    return False
+
 def main():
     """Main execution function."""
     parser = argparse.ArgumentParser(
@@ -411,9 +663,30 @@ def main():
         help='Output directory path',
         default='export'
     )
+    parser.add_argument(
+        '--engine',
+        help='CSV parser: pandas, python, or auto to pick by file size (default: auto)',
+        choices=['auto', 'pandas', 'python'],
+        default='auto'
+    )
+    parser.add_argument(
+        '--pymupdf',
+        help='Extract PDF text with PyMuPDF instead of PyPDF2 (faster; must be installed)',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--jobs',
+        help='Number of files to convert in parallel (1 = serial, default: one per CPU)',
+        type=int,
+        default=None
+    )
     
     args = parser.parse_args()
     
+    if args.pymupdf:
+        # Set in the environment so the worker processes pick it up as well
+        os.environ[PYMUPDF_ENV_VAR] = '1'
+    
     # Determine input file
     if args.input:
         input_files = [args.input]
@@ -421,64 +694,30 @@ def main():
         # Look for CSV and PDF files in current directory and import folder
         search_paths = [Path('.'), Path('import')]
         input_files = []
+        extensions = ('.csv', '.pdf') if PDF_SUPPORT else ('.csv',)
         for search_path in search_paths:
             if search_path.exists():
-                input_files.extend(search_path.glob('*paysera*.csv'))
-                input_files.extend(search_path.glob('*Paysera*.csv'))
-                if PDF_SUPPORT:
-                    input_files.extend(search_path.glob('*paysera*.pdf'))
-                    input_files.extend(search_path.glob('*Paysera*.pdf'))
+                # One directory scan per folder, matching names case-insensitively
+                for entry in os.scandir(search_path):
+                    name_lc = entry.name.lower()
+                    if 'paysera' in name_lc and name_lc.endswith(extensions) and entry.is_file():
+                        input_files.append(Path(entry.path))
         
         if not input_files:
             file_types = "CSV/PDF" if PDF_SUPPORT else "CSV"
             print(f"Error: No Paysera {file_types} files found. Please provide --input parameter or place files in current/import folder.")
             return 1
     
-    # Process each file
-    success_count = 0
-    for input_file in input_files:
-        input_path = Path(input_file)
-        
-        if not input_path.exists():
-            print(f"Error: File not found: {input_path}")
-            continue
-        
-        print(f"\nProcessing: {input_path.name}")
-        print("=" * 60)
-        
-        # Determine file type and parse accordingly
-        file_extension = input_path.suffix.lower()
-        
-        if file_extension == '.pdf':
-            if not PDF_SUPPORT:
-                print(f"Error: PDF support not available. Install PyPDF2 to process PDF files.")
-                continue
-            print("File type: PDF")
-            transactions = parse_paysera_pdf(input_path)
-        elif file_extension == '.csv':
-            print("File type: CSV")
-            transactions = parse_paysera_csv(input_path)
-        else:
-            print(f"Error: Unsupported file type: {file_extension}")
-            continue
-        
-        if not transactions:
-            print(f"No transactions found in {input_path.name}")
-            continue
-        
-        # Generate output filename
-        output_dir = Path(args.output)
-        output_filename = f"{input_path.stem} - 4qbo.csv"
-        output_path = output_dir / output_filename
-        
-        # Write QuickBooks CSV
-        result = write_quickbooks_csv(transactions, output_path)
-        
-        if result:
-            success_count += 1
-            print(f"✓ Converted: {input_path.name} -> {Path(result).name}")
-        else:
-            print(f"✗ Failed to convert: {input_path.name}")
+    # Files are independent, so convert them in parallel unless told otherwise
+    jobs = args.jobs or min(len(input_files), os.cpu_count() or 1)
+    output_dirs = [args.output] * len(input_files)
+    engines = [args.engine] * len(input_files)
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(process_file, input_files, output_dirs, engines))
+    else:
+        results = list(map(process_file, input_files, output_dirs, engines))
+    success_count = sum(results)
     
     print(f"\n{'=' * 60}")
     print(f"Conversion complete: {success_count} file(s) processed")
@@ -23,17 +23,70 @@ Date: October 28, 2025
 import csv
 import sys
 import os
+import mmap
+from collections import namedtuple
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 import re
 import argparse
-try:
-    import PyPDF2
-    PDF_SUPPORT = True
-except ImportError:
-    PDF_SUPPORT = False
-    print("Warning: PyPDF2 not installed. PDF support disabled.")
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import parent_process
+import importlib.util
 
+# The PDF libraries are imported on first use (see get_pdf_backend), so
+# CSV conversions don't pay for loading them; only check they are installed
+PDF_SUPPORT = any(importlib.util.find_spec(name) is not None for name in ('pymupdf', 'fitz', 'PyPDF2'))
+if not PDF_SUPPORT:
+    print("Warning: PyMuPDF/PyPDF2 not installed. PDF support disabled.")
+
+# PyPDF2 is the default PDF library; setting this variable (done by --pymupdf)
+# opts in to PyMuPDF. Worker processes inherit it through the environment.
+PYMUPDF_ENV_VAR = 'QBO_USE_PYMUPDF'
+
+# Give up claiming an output filename after this many collisions
+MAX_OUTPUT_NAME_ATTEMPTS = 100
+
+# Amount cells that mean zero, skipped without parsing
+ZERO_AMOUNTS = frozenset({'', '0.00', '0,00'})
+# One-pass separator cleanup for European ("14.485,28") and US ("14,485.28") amounts
+EUROPEAN_AMOUNT_TABLE = str.maketrans({'.': None, ',': '.'})
+US_AMOUNT_TABLE = str.maketrans({',': None})
+
+# One transaction; field order matches the QuickBooks CSV columns
+Txn = namedtuple('Txn', 'Date Description Debit Credit Balance')
+QUICKBOOKS_HEADER = ['Date', 'Description', 'Debit', 'Credit', 'Balance']
+
+# Buffer size for reading input and writing output CSV files (1 MB)
+IO_BUFFER_SIZE = 1 << 20
+
+# CSV files larger than this are parsed with pandas when it is installed;
+# smaller files are faster through the csv module (no pandas import)
+PANDAS_MIN_CSV_SIZE = 256 * 1024
+
+# Start of the CSV header line: the first line naming both RecordNumber and ValueDate;
+# lines may end in \n, \r\n or a lone \r
+CSV_HEADER_PATTERN = re.compile(
+    rb'(?<![^\r\n])[^\r\n]*?(?:RecordNumber[^\r\n]*ValueDate|ValueDate[^\r\n]*RecordNumber)'
+)
+
+# One PDF transaction row over newline-separated tokens; amounts may be cut off
+# at the end of the text, and the description runs lazily up to the next row
+PDF_ROW_PATTERN = re.compile(
+    r'^\d{1,3}\n[^\n]*\n(\d{2}\.\d{2}\.\d{4}[^\n]*)'
+    r'(?:\n([^\n]*)(?:\n([^\n]*)(?:\n([^\n]*))?)?)?'
+    r'(?:\n(.*?))??'
+    r'(?=\n\d{1,3}\n[^\n]*\n\d{2}\.\d{2}\.\d{4}|\Z)',
+    re.MULTILINE | re.DOTALL
+)
+# Description lines kept per PDF row
+PDF_MAX_DESCRIPTION_LINES = 21
+
+# Each extra PDF worker process needs at least this many pages to pay for its startup
+PARALLEL_PDF_MIN_PAGES_PER_WORKER = 16
+
+@lru_cache(maxsize=8192)
 def parse_procredit_amount(amount_str):
     """
     Parse ProCredit amount format to float.
@@ -45,34 +98,25 @@ def parse_procredit_amount(amount_str):
     Returns:
         float: Parsed amount
     """
-    if not amount_str or amount_str.strip() == '0.00' or amount_str.strip() == '0,00':
+    if not amount_str:
         return 0.0
     
     # Remove any spaces
     amount_str = amount_str.strip()
+    if amount_str in ZERO_AMOUNTS:
+        return 0.0
     
-    # Check if using comma as decimal separator (European format)
-    # Format could be: "14,485.28" or "14.485,28"
-    if ',' in amount_str and '.' in amount_str:
-        # If both exist, determine which is decimal separator
-        comma_pos = amount_str.rfind(',')
-        dot_pos = amount_str.rfind('.')
-        
-        if comma_pos > dot_pos:
-            # Comma is decimal: "14.485,28" -> remove dots, replace comma with dot
-            amount_str = amount_str.replace('.', '').replace(',', '.')
-        else:
-            # Dot is decimal: "14,485.28" -> just remove commas
-            amount_str = amount_str.replace(',', '')
-    elif ',' in amount_str:
-        # Only comma exists, assume it's thousands separator if there are more than 2 digits after
-        parts = amount_str.split(',')
-        if len(parts[-1]) == 2:
-            # It's decimal separator: "14,28" -> "14.28"
-            amount_str = amount_str.replace(',', '.')
+    # Format could be: "14,485.28", "14.485,28", "14,28" or "14,485".
+    # The comma is the decimal separator when it comes after the last dot and
+    # either a dot is present too or exactly two digits follow it.
+    comma_pos = amount_str.rfind(',')
+    if comma_pos != -1:
+        if comma_pos > amount_str.rfind('.') and ('.' in amount_str or comma_pos == len(amount_str) - 3):
+            # European: "14.485,28" -> remove dots, replace comma with dot
+            amount_str = amount_str.translate(EUROPEAN_AMOUNT_TABLE)
         else:
-            # It's thousands separator: "14,485" -> "14485"
-            amount_str = amount_str.replace(',', '')
+            # Comma is a thousands separator: "14,485.28" -> just remove commas
+            amount_str = amount_str.translate(US_AMOUNT_TABLE)
     
     try:
         return float(amount_str)
@@ -80,6 +124,7 @@ def parse_procredit_amount(amount_str):
         print(f"Warning: Could not parse amount '{amount_str}', using 0.0")
         return 0.0
 
+@lru_cache(maxsize=4096)
 def parse_procredit_date(date_str):
     """
     Parse ProCredit date format to ISO format.
@@ -93,8 +138,20 @@ def parse_procredit_date(date_str):
     Returns:
         str: Date in YYYY-MM-DD format
     """
+    s = date_str.strip()
+    
+    # Zero-padded DD.MM.YYYY: rearrange the slices instead of going through
+    # strptime/strftime; datetime() still rejects impossible dates
+    if (len(s) == 10 and s.isascii() and s[2] == '.' and s[5] == '.'
+            and s[:2].isdigit() and s[3:5].isdigit() and s[6:].isdigit()):
+        try:
+            datetime(int(s[6:]), int(s[3:5]), int(s[:2]))
+            return f"{s[6:]}-{s[3:5]}-{s[:2]}"
+        except ValueError:
+            pass
+    
     try:
-        date_obj = datetime.strptime(date_str.strip(), '%d.%m.%Y')
+        date_obj = datetime.strptime(s, '%d.%m.%Y')
         return date_obj.strftime('%Y-%m-%d')
     except ValueError:
         print(f"Warning: Could not parse date '{date_str}'")
@@ -130,27 +187,91 @@ def extract_description(row):
     
     return full_desc
 
+@lru_cache(maxsize=None)
+def get_pdf_backend():
+    """
+    Import the PDF library on first use.
+    
+    PyPDF2 is the default. PyMuPDF (C-backed text extraction) is used
+    instead when opted in through PYMUPDF_ENV_VAR and installed.
+    
+    Returns:
+        tuple: (name, module) with name 'pymupdf' or 'pypdf2', or None if
+        no usable library can be imported
+    """
+    if os.environ.get(PYMUPDF_ENV_VAR):
+        try:
+            import pymupdf as fitz
+            return 'pymupdf', fitz
+        except ImportError:
+            pass
+        try:
+            import fitz  # PyMuPDF releases before the pymupdf module name
+            return 'pymupdf', fitz
+        except ImportError:
+            print("Warning: PyMuPDF not installed, using PyPDF2")
+    try:
+        import PyPDF2
+        return 'pypdf2', PyPDF2
+    except ImportError:
+        return None
+
+def extract_pdf_page_range(pdf_path, start, stop):
+    """
+    Extract the text of pages [start, stop) with PyMuPDF.
+    
+    Runs in a worker process when a long PDF is split across CPUs.
+    
+    Returns:
+        list: Text of each page, in page order
+    """
+    _, fitz = get_pdf_backend()
+    with fitz.open(pdf_path) as doc:
+        return [doc[i].get_text("text") for i in range(start, stop)]
+
 def extract_text_from_pdf(pdf_path):
     """
     Extract text content from ProCredit PDF file.
     
+    Uses PyPDF2, or PyMuPDF when opted in with --pymupdf.
+    
     Args:
         pdf_path: Path to the PDF file
         
     Returns:
         str: Extracted text content
     """
-    if not PDF_SUPPORT:
-        print("Error: PyPDF2 not installed. Cannot process PDF files.")
+    backend = get_pdf_backend()
+    if backend is None:
+        print("Error: PyPDF2 not installed (or use --pymupdf with PyMuPDF). Cannot process PDF files.")
         return ""
+    backend_name, pdf_module = backend
     
     try:
+        if backend_name == 'pymupdf':
+            with pdf_module.open(pdf_path) as doc:
+                page_count = doc.page_count
+                workers = min(os.cpu_count() or 1, page_count // PARALLEL_PDF_MIN_PAGES_PER_WORKER)
+                # A batch run already converts one file per worker process;
+                # don't start a second pool inside one of those workers
+                if workers < 2 or parent_process() is not None:
+                    return '\n'.join(page.get_text("text") for page in doc)
+            
+            # Long statement: split the pages into one contiguous range per worker.
+            # PyMuPDF is not thread-safe, so the workers are processes that each
+            # open their own copy of the document.
+            chunk = -(-page_count // workers)
+            starts = list(range(0, page_count, chunk))
+            stops = [min(start + chunk, page_count) for start in starts]
+            with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+                parts = executor.map(extract_pdf_page_range, [str(pdf_path)] * len(starts), starts, stops)
+                return '\n'.join(text for part in parts for text in part)
+        
         with open(pdf_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text()
-            return text
+            reader = pdf_module.PdfReader(file)
+            # Join once instead of growing a string page by page; the newline
+            # keeps a page's last token from running into the next page's first
+            return '\n'.join(page.extract_text() for page in reader.pages)
     except Exception as e:
         print(f"Error extracting PDF text: {e}")
         return ""
@@ -166,7 +287,7 @@ def parse_procredit_pdf(pdf_path):
         pdf_path: Path to the PDF file
         
     Returns:
-        list: List of transaction dictionaries
+        list: List of Txn records
     """
     transactions = []
     text = extract_text_from_pdf(pdf_path)
@@ -189,78 +310,38 @@ def parse_procredit_pdf(pdf_path):
             print("Error: Could not find data start in PDF")
             return transactions
         
-        # Process tokens in groups
-        i = start_index
-        while i < len(tokens):
-            token = tokens[i]
+        # Match whole rows over the token lines: row number, transaction
+        # number, date, debit, credit, balance, then description lines up to
+        # the next row (a 1-3 digit number with a date two lines below)
+        for match in PDF_ROW_PATTERN.finditer('\n'.join(tokens[start_index:])):
+            date_str, debit_str, credit_str, balance_str, details = match.groups()
+            
+            # Parse amounts (a row cut off by the end of the text counts missing ones as zero)
+            debit = parse_procredit_amount(debit_str or "0.00")
+            credit = parse_procredit_amount(credit_str or "0.00")
+            balance = parse_procredit_amount(balance_str or "0.00")
             
-            # Check if this is a row number (start of new transaction)
-            if token.isdigit() and len(token) <= 3:  # Row numbers are 1-3 digits
-                try:
-                    # Extract transaction fields
-                    row_num = token
-                    trans_num = tokens[i + 1] if i + 1 < len(tokens) else ""
-                    date_str = tokens[i + 2] if i + 2 < len(tokens) else ""
-                    debit_str = tokens[i + 3] if i + 3 < len(tokens) else "0.00"
-                    credit_str = tokens[i + 4] if i + 4 < len(tokens) else "0.00"
-                    balance_str = tokens[i + 5] if i + 5 < len(tokens) else "0.00"
-                    
-                    # Validate date format
-                    if not re.match(r'\d{2}\.\d{2}\.\d{4}', date_str):
-                        i += 1
-                        continue
-                    
-                    # Parse amounts
-                    debit = parse_procredit_amount(debit_str)
-                    credit = parse_procredit_amount(credit_str)
-                    balance = parse_procredit_amount(balance_str)
-                    
-                    # Parse date
-                    date = parse_procredit_date(date_str)
-                    
-                    # Collect description (transaction type + comments)
-                    description_parts = []
-                    j = i + 6
-                    
-                    # Look ahead for description text until we hit another row number
-                    while j < len(tokens):
-                        next_token = tokens[j]
-                        
-                        # Stop if we hit another row number with valid date pattern ahead
-                        if next_token.isdigit() and len(next_token) <= 3:
-                            # Check if next tokens look like a new transaction
-                            if j + 2 < len(tokens) and re.match(r'\d{2}\.\d{2}\.\d{4}', tokens[j + 2]):
-                                break
-                        
-                        description_parts.append(next_token)
-                        j += 1
-                        
-                        # Limit description length
-                        if len(description_parts) > 20:
-                            break
-                    
-                    description = ' '.join(description_parts).strip()
-                    if not description:
-                        description = "Transaction"
-                    
-                    # Clean up description
-                    description = ' '.join(description.split())  # Remove extra spaces
-                    
-                    transaction = {
-                        'Date': date,
-                        'Description': description,
-                        'Debit': debit if debit > 0 else 0,
-                        'Credit': credit if credit > 0 else 0,
-                        'Balance': balance
-                    }
-                    
-                    transactions.append(transaction)
-                    i = j  # Move to next transaction
-                    
-                except (IndexError, ValueError) as e:
-                    i += 1
-            else:
-                i += 1
+            # Parse date
+            date = parse_procredit_date(date_str)
+            
+            # Description is the transaction type + comments, limited in length;
+            # one split/join both turns line breaks into spaces and collapses
+            # repeated spaces inside a token
+            if details and details.count('\n') >= PDF_MAX_DESCRIPTION_LINES:
+                details = details.split('\n', PDF_MAX_DESCRIPTION_LINES)
+                details.pop()
+                details = '\n'.join(details)
+            description = ' '.join(details.split()) if details else ''
+            if not description:
+                description = "Transaction"
+            
+            transactions.append(Txn(
+                date,
+                description,
+                debit if debit > 0 else 0,
+                credit if credit > 0 else 0,
+                balance
+            ))
         
         print(f"Successfully parsed {len(transactions)} transactions from PDF")
         return transactions
@@ -271,6 +352,80 @@ def parse_procredit_pdf(pdf_path):
         traceback.print_exc()
         return []
 
+def seek_to_csv_header(file):
+    """
+    Position an open CSV file at the start of the transaction header row.
+    
+    The header row is the line containing RecordNumber and ValueDate;
+    everything above it is statement metadata. One regex search runs over a
+    memory map of the raw bytes, so nothing above the header is decoded.
+    
+    Args:
+        file: CSV file opened in text mode
+        
+    Returns:
+        bool: True if the header was found
+    """
+    if os.fstat(file.fileno()).st_size == 0:
+        return False
+    
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        match = CSV_HEADER_PATTERN.search(mm)
+        if match is None:
+            return False
+        file.seek(match.start())
+        return True
+
+def iter_procredit_csv(csv_path):
+    """
+    Stream transactions from a ProCredit Bank CSV file one row at a time.
+    
+    Parse errors propagate to the caller.
+    
+    Args:
+        csv_path: Path to the CSV file
+        
+    Yields:
+        Txn: One transaction per data row
+    """
+    count = 0
+    
+    with open(csv_path, 'r', encoding='utf-8-sig', buffering=IO_BUFFER_SIZE) as file:
+        # Skip to the header row (contains RecordNumber, City1, ValueDate, etc.)
+        if not seek_to_csv_header(file):
+            print("Error: Could not find transaction data header")
+            return
+        
+        # Stream rows from the header row onwards
+        reader = csv.DictReader(file)
+        
+        for row in reader:
+            # Skip empty rows
+            if not row.get('ValueDate'):
+                continue
+            
+            # Parse amounts
+            debit_amount = parse_procredit_amount(row.get('Amount', '0'))
+            credit_amount = parse_procredit_amount(row.get('Amount1', '0'))
+            balance = parse_procredit_amount(row.get('BalanceAfter', '0'))
+            
+            # Parse date
+            date = parse_procredit_date(row.get('ValueDate', ''))
+            
+            # Extract description
+            description = extract_description(row)
+            
+            count += 1
+            yield Txn(
+                date,
+                description,
+                debit_amount if debit_amount > 0 else 0,
+                credit_amount if credit_amount > 0 else 0,
+                balance
+            )
+    
+    print(f"Successfully parsed {count} transactions")
+
 def parse_procredit_csv(csv_path):
     """
     Parse ProCredit Bank CSV file and extract transactions.
@@ -279,90 +434,158 @@ def parse_procredit_csv(csv_path):
         csv_path: Path to the CSV file
         
     Returns:
-        list: List of transaction dictionaries
+        list: List of Txn records
     """
-    transactions = []
+    try:
+        return list(iter_procredit_csv(csv_path))
+        
+    except Exception as e:
+        print(f"Error parsing CSV: {e}")
+        return []
+
+def stream_procredit_csv(csv_path):
+    """
+    Open a ProCredit Bank CSV file as a lazy stream of transactions.
+    
+    Reads the first row up front so empty or unreadable files can be
+    reported before an output file is created.
+    
+    Args:
+        csv_path: Path to the CSV file
+        
+    Returns:
+        Iterable of Txn records, or an empty list if there are none
+    """
+    transactions = iter_procredit_csv(csv_path)
+    try:
+        first = next(transactions, None)
+    except Exception as e:
+        print(f"Error parsing CSV: {e}")
+        return []
+    return chain((first,), transactions) if first is not None else []
+
+def parse_procredit_csv_pandas(csv_path):
+    """
+    Parse ProCredit Bank CSV file with pandas, using column operations instead of a row loop.
+    
+    Produces the same records as parse_procredit_csv.
+    
+    Args:
+        csv_path: Path to the CSV file
+        
+    Returns:
+        list: List of Txn records
+        
+    Raises:
+        ImportError: If pandas is not installed
+    """
+    import pandas as pd  # Imported here so small files never pay for it
     
     try:
         with open(csv_path, 'r', encoding='utf-8-sig') as file:
-            # Read all lines to find the actual data start
-            lines = file.readlines()
-            
-            # Find the header row (contains RecordNumber, City1, ValueDate, etc.)
-            header_row_index = -1
-            for i, line in enumerate(lines):
-                if 'RecordNumber' in line and 'ValueDate' in line:
-                    header_row_index = i
-                    break
-            
-            if header_row_index == -1:
+            if not seek_to_csv_header(file):
                 print("Error: Could not find transaction data header")
-                return transactions
-            
-            # Read from the header row onwards
-            reader = csv.DictReader(lines[header_row_index:])
-            
-            for row in reader:
-                # Skip empty rows
-                if not row.get('ValueDate'):
-                    continue
-                
-                # Parse amounts
-                debit_amount = parse_procredit_amount(row.get('Amount', '0'))
-                credit_amount = parse_procredit_amount(row.get('Amount1', '0'))
-                balance = parse_procredit_amount(row.get('BalanceAfter', '0'))
-                
-                # Parse date
-                date = parse_procredit_date(row.get('ValueDate', ''))
-                
-                # Extract description
-                description = extract_description(row)
-                
-                transaction = {
-                    'Date': date,
-                    'Description': description,
-                    'Debit': debit_amount if debit_amount > 0 else 0,
-                    'Credit': credit_amount if credit_amount > 0 else 0,
-                    'Balance': balance
-                }
-                
-                transactions.append(transaction)
+                return []
+            df = pd.read_csv(file, dtype=str, keep_default_na=False, index_col=False)
+        
+        def column(name):
+            if name in df.columns:
+                return df[name].fillna('')
+            return pd.Series('', index=df.index)
+        
+        # Skip empty rows
+        df = df[column('ValueDate') != '']
+        
+        def amounts(name):
+            # Same separator rules as parse_procredit_amount, applied per column
+            values = column(name).str.strip()
+            comma_pos = values.str.rfind(',')
+            dot_pos = values.str.rfind('.')
+            has_comma = comma_pos != -1
+            european = has_comma & (comma_pos > dot_pos) & ((dot_pos != -1) | (comma_pos == values.str.len() - 3))
+            values = values.where(~european, values.str.translate(EUROPEAN_AMOUNT_TABLE))
+            values = values.where(~(has_comma & ~european), values.str.translate(US_AMOUNT_TABLE))
+            numbers = pd.to_numeric(values, errors='coerce')
+            for bad in values[numbers.isna() & ~values.isin(ZERO_AMOUNTS)]:
+                print(f"Warning: Could not parse amount '{bad}', using 0.0")
+            return numbers.fillna(0.0)
+        
+        debit = amounts('Amount')
+        credit = amounts('Amount1')
+        balance = amounts('BalanceAfter')
+        
+        # Combine TransactionType and Description1, collapsing whitespace
+        transaction_type = column('TransactionType').str.strip()
+        details = column('Description1').str.strip()
+        both = (transaction_type != '') & (details != '')
+        descriptions = (transaction_type + ' | ' + details).where(both, transaction_type + details)
+        descriptions = descriptions.str.split().str.join(' ')
+        descriptions = descriptions.where(descriptions != '', 'Transaction')
+        
+        result = pd.DataFrame({
+            'Date': column('ValueDate').map(parse_procredit_date),
+            'Description': descriptions,
+            'Debit': debit.where(debit > 0, 0),
+            'Credit': credit.where(credit > 0, 0),
+            'Balance': balance
+        })
+        transactions = list(map(Txn._make, result.itertuples(index=False, name=None)))
         
         print(f"Successfully parsed {len(transactions)} transactions")
         return transactions
         
     except Exception as e:
-        print(f"Error parsing CSV: {e}")
-        return []
+        # pandas is stricter than the csv module (e.g. ragged rows); let the
+        # row-by-row parser handle whatever it rejects
+        print(f"Warning: pandas could not parse CSV ({e}), using the csv module")
+        return parse_procredit_csv(csv_path)
 
-def get_versioned_filename(file_path):
+def get_versioned_filename(file_path, taken=()):
     """
     Generate a versioned filename to avoid overwriting existing files.
     
     Args:
         file_path: Original file path
+        taken: File names to treat as used even if they do not exist on disk
         
     Returns:
         Path: New file path with version suffix if needed
     """
     path = Path(file_path)
-    if not path.exists():
+    taken = {os.path.normcase(name) for name in taken}
+    if os.path.normcase(path.name) not in taken and not path.exists():
         return path
     
+    # List the directory once instead of a stat() call per candidate version
+    existing = {os.path.normcase(entry.name) for entry in os.scandir(path.parent)}
+    existing |= taken
+    
     counter = 1
     while True:
         new_name = f"{path.stem} (v.{counter}){path.suffix}"
-        new_path = path.parent / new_name
-        if not new_path.exists():
-            return new_path
+        if os.path.normcase(new_name) not in existing:
+            return path.parent / new_name
         counter += 1
 
+@lru_cache(maxsize=None)
+def ensure_directory(directory):
+    """
+    Create an output directory (and parents) once per process.
+    
+    Batch runs write every file to the same folder, so later calls skip the
+    mkdir system call entirely.
+    
+    Args:
+        directory: Directory path as a string
+    """
+    Path(directory).mkdir(parents=True, exist_ok=True)
+
 def write_quickbooks_csv(transactions, output_path):
     """
     Write transactions to QuickBooks-compatible CSV format.
     
     Args:
-        transactions: List of transaction dictionaries
+        transactions: Iterable of Txn records (may be a generator)
         output_path: Path for output CSV file
         
     Returns:
@@ -370,35 +593,117 @@ def write_quickbooks_csv(transactions, output_path):
     """
     # Ensure output directory exists
     output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Get versioned filename
-    output_path = get_versioned_filename(output_path)
+    ensure_directory(str(output_path.parent))
     
+    created = False
     try:
-        with open(output_path, 'w', newline='', encoding='utf-8') as file:
+        # Claim a versioned filename; another worker may take the same name
+        # between the check and the open, in which case pick the next one
+        requested_path = output_path
+        taken = set()
+        for _ in range(MAX_OUTPUT_NAME_ATTEMPTS):
+            output_path = get_versioned_filename(requested_path, taken)
+            try:
+                file = open(output_path, 'x', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE)
+                created = True
+                break
+            except FileExistsError:
+                # Move past the name that collided even if the directory
+                # listing does not show it (dangling symlink, case folding)
+                taken.add(output_path.name)
+        else:
+            raise FileExistsError(f"No free output filename for {requested_path}")
+        
+        with file:
             writer = csv.writer(file)
             
             # Write header
-            writer.writerow(['Date', 'Description', 'Debit', 'Credit', 'Balance'])
+            writer.writerow(QUICKBOOKS_HEADER)
             
-            # Write transactions
-            for trans in transactions:
-                writer.writerow([
-                    trans['Date'],
-                    trans['Description'],
-                    f"{trans['Debit']:.2f}" if trans['Debit'] > 0 else '',
-                    f"{trans['Credit']:.2f}" if trans['Credit'] > 0 else '',
-                    f"{trans['Balance']:.2f}"
-                ])
+            # Write transactions; zero debit/credit cells stay empty
+            writer.writerows(
+                (
+                    date,
+                    description,
+                    f"{debit:.2f}" if debit > 0 else '',
+                    f"{credit:.2f}" if credit > 0 else '',
+                    f"{balance:.2f}"
+                )
+                for date, description, debit, credit, balance in transactions
+            )
         
         print(f"✓ QuickBooks CSV created: {output_path}")
         return str(output_path)
         
     except Exception as e:
         print(f"Error writing CSV: {e}")
+        # Don't leave a half-written file behind when a streamed input fails
+        if created:
+            output_path.unlink(missing_ok=True)
         return None
 
+def process_file(input_file, output_dir):
+    """
+    Convert one ProCredit CSV or PDF file to a QuickBooks CSV.
+    
+    Args:
+        input_file: Path to the input file
+        output_dir: Directory for the output CSV
+        
+    Returns:
+        bool: True if an output file was written
+    """
+    input_path = Path(input_file)
+    
+    if not input_path.exists():
+        print(f"Error: File not found: {input_path}")
+        return False
+    
+    print(f"\nProcessing: {input_path.name}")
+    print("=" * 60)
+    
+    # Determine file type and parse accordingly
+    file_extension = input_path.suffix.lower()
+    
+    if file_extension == '.pdf':
+        if not PDF_SUPPORT:
+            print(f"Error: PDF support not available. Install PyMuPDF or PyPDF2 to process PDF files.")
+            return False
+        print("File type: PDF")
+        transactions = parse_procredit_pdf(input_path)
+    elif file_extension == '.csv':
+        print("File type: CSV")
+        transactions = None
+        if input_path.stat().st_size > PANDAS_MIN_CSV_SIZE:
+            try:
+                transactions = parse_procredit_csv_pandas(input_path)
+            except ImportError:
+                pass
+        if transactions is None:
+            # Stream rows straight into the writer
+            transactions = stream_procredit_csv(input_path)
+    else:
+        print(f"Error: Unsupported file type: {file_extension}")
+        return False
+    
+    if not transactions:
+        print(f"No transactions found in {input_path.name}")
+        return False
+    
+    # Generate output filename
+    output_filename = f"{input_path.stem} - 4qbo.csv"
+    output_path = Path(output_dir) / output_filename
+    
+    # Write QuickBooks CSV
+    result = write_quickbooks_csv(transactions, output_path)
+    
+    if result:
+        print(f"✓ Converted: {input_path.name} -> {Path(result).name}")
+        return True
+    
+    print(f"✗ Failed to convert: {input_path.name}")
+    return False
+
 def main():
     """Main execution function."""
     parser = argparse.ArgumentParser(
@@ -414,72 +719,53 @@ def main():
         help='Output directory path',
         default='export'
     )
+    parser.add_argument(
+        '--jobs',
+        help='Number of files to convert in parallel (1 = serial, default: one per CPU)',
+        type=int,
+        default=None
+    )
+    parser.add_argument(
+        '--pymupdf',
+        help='Extract PDF text with PyMuPDF instead of PyPDF2 (faster; must be installed)',
+        action='store_true'
+    )
     
     args = parser.parse_args()
     
+    if args.pymupdf:
+        # Set in the environment so the worker processes pick it up as well
+        os.environ[PYMUPDF_ENV_VAR] = '1'
+    
     # Determine input file
     if args.input:
         input_files = [args.input]
     else:
         # Look for CSV and PDF files in current directory and import folder
         search_paths = [Path('.'), Path('import')]
+        extensions = ('.csv', '.pdf') if PDF_SUPPORT else ('.csv',)
         input_files = []
         for search_path in search_paths:
             if search_path.exists():
-                input_files.extend(search_path.glob('*.csv'))
-                if PDF_SUPPORT:
-                    input_files.extend(search_path.glob('*.pdf'))
+                # One directory scan per folder for both extensions
+                for entry in os.scandir(search_path):
+                    if entry.name.lower().endswith(extensions) and entry.is_file():
+                        input_files.append(Path(entry.path))
         
         if not input_files:
             file_types = "CSV/PDF" if PDF_SUPPORT else "CSV"
             print(f"Error: No {file_types} files found. Please provide --input parameter or place files in current/import folder.")
             return 1
     
-    # Process each file
-    success_count = 0
-    for input_file in input_files:
-        input_path = Path(input_file)
-        
-        if not input_path.exists():
-            print(f"Error: File not found: {input_path}")
-            continue
-        
-        print(f"\nProcessing: {input_path.name}")
-        print("=" * 60)
-        
-        # Determine file type and parse accordingly
-        file_extension = input_path.suffix.lower()
-        
-        if file_extension == '.pdf':
-            if not PDF_SUPPORT:
-                print(f"Error: PDF support not available. Install PyPDF2 to process PDF files.")
-                continue
-            print("File type: PDF")
-            transactions = parse_procredit_pdf(input_path)
-        elif file_extension == '.csv':
-            print("File type: CSV")
-            transactions = parse_procredit_csv(input_path)
-        else:
-            print(f"Error: Unsupported file type: {file_extension}")
-            continue
-        
-        if not transactions:
-            print(f"No transactions found in {input_path.name}")
-            continue
-        
-        # Generate output filename
-        output_dir = Path(args.output)
-        output_filename = f"{input_path.stem} - 4qbo.csv"
-        output_path = output_dir / output_filename
-        
-        # Write QuickBooks CSV
-        result = write_quickbooks_csv(transactions, output_path)
-        
-        if result:
-            success_count += 1
-            print(f"✓ Converted: {input_path.name} -> {Path(result).name}")
-        else:
-            print(f"✗ Failed to convert: {input_path.name}")
+    # Files are independent, so convert them in parallel unless told otherwise
+    jobs = args.jobs or min(len(input_files), os.cpu_count() or 1)
+    output_dirs = [args.output] * len(input_files)
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(process_file, input_files, output_dirs))
+    else:
+        results = list(map(process_file, input_files, output_dirs))
+    success_count = sum(results)
     
     print(f"\n{'=' * 60}")
     print(f"Conversion complete: {success_count} file(s) processed")
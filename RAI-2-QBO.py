@@ -5,25 +5,87 @@ Converts Raiffeisen bank statement files (CSV or PDF) to a simplified QBO-compat
 """
 
 import csv
+import io
+import mmap
+import os
 import re
+from collections import namedtuple
 from pathlib import Path
 from datetime import datetime
-import PyPDF2
+from functools import lru_cache
+from itertools import chain, count
 
 
-def get_versioned_filename(file_path):
+# CSV files larger than this are read with pandas when it is installed;
+# smaller files are faster through the csv module (no pandas import)
+PANDAS_MIN_CSV_SIZE = 256 * 1024
+
+# Give up claiming an output filename after this many collisions
+MAX_OUTPUT_NAME_ATTEMPTS = 100
+
+# One converted CSV transaction; field order matches the output columns
+Txn = namedtuple('Txn', 'Date Description Amount Balance')
+
+# One transaction parsed from a PDF statement (debit/credit are floats or '')
+PdfTxn = namedtuple('PdfTxn', 'date description debit credit balance')
+
+# Whitespace and currency codes stripped from amounts
+CURRENCY_PATTERN = re.compile(r'\s+|ALL|USD|EUR')
+
+# Fixed-point amounts with at most two decimals (sign, whole part, decimals);
+# these are converted as integer cents, anything else goes through float()
+FIXED_POINT_PATTERN = re.compile(r'([+-]?)(?=\.?[0-9])([0-9]*)(?:\.([0-9]{0,2}))?')
+
+# Read buffer for input CSV files (1 MB); the header search and the
+# parser share one file handle, so rows come in a few large reads
+IO_BUFFER_SIZE = 1 << 20
+
+# PyPDF2 is the default PDF library; setting this variable (done by --pymupdf)
+# opts in to PyMuPDF
+PYMUPDF_ENV_VAR = 'QBO_USE_PYMUPDF'
+
+# PDF transaction block: XBEN [No] [Date] [Beneficiary] [Debit] ALL [Credit] [Balance]
+XBEN_TRANSACTION_PATTERN = re.compile(
+    r'XBEN\s+(\d+)\s+(\d{2}\.\d{2}\.\d{4})\s+([A-Z0-9\s\(\)\.]+?)\s+([\d,]+\.?\d*)\s+ALL\s+([\d,]+\.?\d*)\s+([-\d,]+\.?\d*)'
+)
+
+# Reference (e.g. P250530AJDIOP14) and description at the end of the text before a block
+PDF_REFERENCE_PATTERN = re.compile(r'(P\d{6}[A-Z0-9]+)\s+([^\s]+(?:\s+[^\s]+)*?)$')
+
+# Debit/credit/balance text (commas and balance sign removed) that float() accepts
+PDF_AMOUNT_PATTERN = re.compile(r'\d+\.?\d*|\.\d+')
+
+# PDF page header text that ends up in a beneficiary when a block is misparsed
+PDF_HEADER_TEXT_PATTERN = re.compile(r'No Posting|DateReference|Balance Credit Debit|Transaction  Details')
+
+# CSV columns used by the conversion
+CSV_COLUMNS = [
+    'No',
+    'Processing Date',
+    'Transaction Type',
+    'Beneficairy/Ordering name and account number',
+    'Description',
+    'Reference',
+    'Amount',
+    'Amount Total',
+]
+
+
+def get_versioned_filename(file_path, taken=()):
     """
     If the file exists, append (v.1), (v.2), etc. to the filename.
     
     Args:
         file_path: Path object to the file
+        taken: File names to treat as existing even if not listed on disk
     
     Returns:
         Path object with versioned filename if needed
     """
     file_path = Path(file_path)
+    taken = {os.path.normcase(name) for name in taken}
     
-    if not file_path.exists():
+    if os.path.normcase(file_path.name) not in taken and not file_path.exists():
         return file_path
     
     # File exists, add version number
@@ -32,14 +94,18 @@ def get_versioned_filename(file_path):
     suffix = file_path.suffix
     parent = file_path.parent
     
+    # List the directory once instead of a stat() call per candidate version
+    existing = {os.path.normcase(entry.name) for entry in os.scandir(parent)}
+    existing |= taken
+    
     while True:
         new_name = f"{stem} (v.{version}){suffix}"
-        new_path = parent / new_name
-        if not new_path.exists():
-            return new_path
+        if os.path.normcase(new_name) not in existing:
+            return parent / new_name
         version += 1
 
 
+@lru_cache(maxsize=4096)
 def format_date(date_str):
     """
     Convert date from DD.MM.YYYY to MM/DD/YYYY format.
@@ -51,9 +117,22 @@ def format_date(date_str):
     Returns:
         Date string in MM/DD/YYYY format (e.g., 09/01/2025)
     """
+    s = date_str.strip()
+    
+    # Zero-padded DD.MM.YYYY: rearrange the slices instead of going through
+    # strptime/strftime; datetime() still rejects impossible dates. Years
+    # before 1000 are left to strftime, which doesn't zero-pad them.
+    if (len(s) == 10 and s.isascii() and s[2] == '.' and s[5] == '.' and s[6] != '0'
+            and s[:2].isdigit() and s[3:5].isdigit() and s[6:].isdigit()):
+        try:
+            datetime(int(s[6:]), int(s[3:5]), int(s[:2]))
+            return f"{s[3:5]}/{s[:2]}/{s[6:]}"
+        except ValueError:
+            pass
+    
     try:
         # Parse the date (format: DD.MM.YYYY)
-        date_obj = datetime.strptime(date_str.strip(), "%d.%m.%Y")
+        date_obj = datetime.strptime(s, "%d.%m.%Y")
         # Format as MM/DD/YYYY (e.g., 09/01/2025)
         return date_obj.strftime("%m/%d/%Y")
     except Exception as e:
@@ -64,21 +143,29 @@ def format_date(date_str):
 def clean_amount(amount_str):
     """
     Clean and convert amount string to number format.
-    Removes spaces, currency codes (ALL, USD, EUR), and converts to float.
+    Removes whitespace, currency codes (ALL, USD, EUR), and formats
+    fixed-point amounts with two decimals.
     
     Args:
         amount_str: Amount string like "-500 ALL" or "3900 USD"
     
     Returns:
-        Cleaned number string
+        Cleaned number string (e.g., "-500.00")
     """
     if not amount_str or amount_str.strip() == '':
         return ''
     
     try:
-        # Remove spaces and currency codes (ALL, USD, EUR, etc.)
-        cleaned = amount_str.replace(' ', '').replace('ALL', '').replace('USD', '').replace('EUR', '').strip()
-        # Convert to float and back to string to validate
+        # Remove whitespace and currency codes (ALL, USD, EUR) in one pass
+        cleaned = CURRENCY_PATTERN.sub('', amount_str)
+        match = FIXED_POINT_PATTERN.fullmatch(cleaned)
+        if match:
+            # Work in integer cents so no binary float rounding gets in
+            sign, whole, decimals = match.groups()
+            cents = int(whole or '0') * 100 + int((decimals or '').ljust(2, '0'))
+            return f"{'-' if sign == '-' else ''}{cents // 100}.{cents % 100:02d}"
+        # Exponents, longer fractions etc. - validate with float and keep its
+        # text, so no digits are rounded away (e.g. "1.005" stays "1.005")
         value = float(cleaned)
         return str(value)
     except Exception as e:
@@ -90,6 +177,8 @@ def merge_description(transaction_type, beneficiary, description, reference):
     """
     Merge multiple fields into a single description field.
     
+    All fields are expected to be stripped by the caller.
+    
     Args:
         transaction_type: Transaction type (e.g., "Payment", "XBEN")
         beneficiary: Beneficiary/Ordering name and account number
@@ -99,36 +188,75 @@ def merge_description(transaction_type, beneficiary, description, reference):
     Returns:
         Merged description string
     """
-    parts = []
-    
-    # Add transaction type
-    if transaction_type and transaction_type.strip():
-        parts.append(transaction_type.strip())
-    
-    # Add beneficiary
-    if beneficiary and beneficiary.strip():
-        parts.append(beneficiary.strip())
-    
-    # Add description
-    if description and description.strip():
-        parts.append(description.strip())
+    # Fields arrive already stripped; empty ones are left out and the
+    # reference goes last with a "Ref: " prefix
+    return ' '.join(
+        part for part in (
+            transaction_type,
+            beneficiary,
+            description,
+            f"Ref: {reference}" if reference else ''
+        ) if part
+    )
+
+
+@lru_cache(maxsize=None)
+def get_pdf_backend():
+    """
+    Import the PDF library on first use.
     
-    # Add reference at the end with "Ref: " prefix
-    if reference and reference.strip():
-        parts.append(f"Ref: {reference.strip()}")
+    PyPDF2 is the default. PyMuPDF (C-backed text extraction) is used
+    instead when opted in through PYMUPDF_ENV_VAR and installed.
     
-    # Join with space between parts
-    return ' '.join(parts)
+    Returns:
+        tuple: (name, module) with name 'pymupdf' or 'pypdf2', or None if
+        no usable library can be imported
+    """
+    if os.environ.get(PYMUPDF_ENV_VAR):
+        try:
+            import pymupdf as fitz
+            return 'pymupdf', fitz
+        except ImportError:
+            pass
+        try:
+            import fitz  # PyMuPDF releases before the pymupdf module name
+            return 'pymupdf', fitz
+        except ImportError:
+            print("  [WARNING] PyMuPDF not installed, using PyPDF2")
+    try:
+        import PyPDF2
+        return 'pypdf2', PyPDF2
+    except ImportError:
+        return None
+
+
+def quote_csv_field(value):
+    """
+    Quote a CSV field the way csv.writer does by default: only when it
+    contains a comma, a quote or a line break, with quotes doubled.
+    """
+    if ',' in value or '"' in value or '\r' in value or '\n' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
 
 
 def extract_text_from_pdf(pdf_path):
-    """Extract text from all pages of a PDF file."""
+    """Extract text from all pages of a PDF file (PyPDF2, or PyMuPDF with --pymupdf)."""
     text = ""
     try:
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
+        backend = get_pdf_backend()
+        if backend is None:
+            raise ImportError("Install PyPDF2 (or PyMuPDF and pass --pymupdf) to process PDF files")
+        name, module = backend
+        if name == 'pymupdf':
+            with module.open(pdf_path) as doc:
+                text = "\n".join(page.get_text("text") for page in doc)
+        else:
+            # PyPDF2 does many small seeks and reads; serve them from memory
+            with open(pdf_path, 'rb') as file:
+                data = file.read()
+            pdf_reader = module.PdfReader(io.BytesIO(data))
+            text = "".join(page.extract_text() + "\n" for page in pdf_reader.pages)
     except Exception as e:
         print(f"  [ERROR] Error extracting text from PDF: {e}")
     return text
@@ -145,7 +273,7 @@ def parse_raiffeisen_pdf(text_content):
         text_content: Extracted text from PDF
     
     Returns:
-        List of transaction dictionaries
+        List of PdfTxn records
     """
     transactions = []
     
@@ -160,13 +288,11 @@ def parse_raiffeisen_pdf(text_content):
     # Correct structure based on validation: Amount1=Debit, Amount2=Credit, Amount3=Balance
     # (Header shows "Balance Credit Debit" but actual order in text is Debit Credit Balance)
     # Beneficiary can be: Name (account), IBAN, or text - stop before large numbers
-    
-    pattern = r'XBEN\s+(\d+)\s+(\d{2}\.\d{2}\.\d{4})\s+([A-Z0-9\s\(\)\.]+?)\s+([\d,]+\.?\d*)\s+ALL\s+([\d,]+\.?\d*)\s+([-\d,]+\.?\d*)'
-    
-    matches = re.finditer(pattern, text)
+    matches = XBEN_TRANSACTION_PATTERN.finditer(text)
     
     corrupted_count = 0
     skipped_count = 0
+    short_description_count = 0
     
     for match in matches:
         try:
@@ -187,18 +313,15 @@ def parse_raiffeisen_pdf(text_content):
                 corrupted_count += 1
             
             # Check 2: Description should not contain suspicious patterns
-            suspicious_patterns = ['No Posting', 'DateReference', 'Balance Credit Debit', 'Transaction  Details']
-            if any(pattern in beneficiary for pattern in suspicious_patterns):
+            if PDF_HEADER_TEXT_PATTERN.search(beneficiary):
                 print(f"  [WARNING] Transaction {trans_no}: Description contains PDF header text - skipping")
                 is_corrupted = True
                 corrupted_count += 1
             
-            # Check 3: Amounts should be valid numbers
-            try:
-                float(amount1)
-                float(amount2)
-                float(amount3.replace('-', ''))  # Balance can be negative
-            except ValueError:
+            # Check 3: Amounts should be valid numbers (balance can be negative)
+            if not (PDF_AMOUNT_PATTERN.fullmatch(amount1)
+                    and PDF_AMOUNT_PATTERN.fullmatch(amount2)
+                    and PDF_AMOUNT_PATTERN.fullmatch(amount3.replace('-', ''))):
                 print(f"  [WARNING] Transaction {trans_no}: Invalid amount format - skipping")
                 is_corrupted = True
                 skipped_count += 1
@@ -209,16 +332,22 @@ def parse_raiffeisen_pdf(text_content):
                 continue
             
             # Based on actual PDF structure: amount1=Debit, amount2=Credit, amount3=Balance
-            debit_amount = float(amount1) if amount1 and float(amount1) > 0 else 0
-            credit_amount = float(amount2) if amount2 and float(amount2) > 0 else 0
+            # (both unsigned, so anything but zero is positive)
+            debit_amount = float(amount1)
+            credit_amount = float(amount2)
             balance = amount3
             
             # Extract description from text before XBEN
-            # Look backwards from match position to find the reference and description
-            text_before = text[:match.start()]
+            # Look backwards from match position to find the reference and description;
+            # only the last 500 characters are searched, so only those are copied
+            start = match.start()
+            text_before = text[max(0, start - 500):start]
             
-            # Try to find the reference (format: P250530AJDIOP14 or similar)
-            ref_match = re.search(r'(P\d{6}[A-Z0-9]+)\s+([^\s]+(?:\s+[^\s]+)*?)$', text_before[-500:])
+            # Try to find the reference (format: P250530AJDIOP14 or similar). The
+            # pattern has to end on a non-space, so skip the search when it can't.
+            ref_match = None
+            if text_before and not text_before[-1].isspace():
+                ref_match = PDF_REFERENCE_PATTERN.search(text_before)
             
             reference = ref_match.group(1) if ref_match else ''
             description_part = ref_match.group(2) if ref_match else beneficiary
@@ -227,16 +356,23 @@ def parse_raiffeisen_pdf(text_content):
             description = f"{beneficiary} | Ref: {reference}" if reference else beneficiary
             description = description.strip()[:500]
             
-            # Create transaction dictionary
-            transaction = {
-                'date': format_date(value_date),
-                'description': description,
-                'debit': debit_amount if debit_amount > 0 else '',
-                'credit': credit_amount if credit_amount > 0 else '',
-                'balance': balance
-            }
+            transactions.append(PdfTxn(
+                format_date(value_date),
+                description,
+                debit_amount or '',
+                credit_amount or '',
+                balance
+            ))
             
-            transactions.append(transaction)
+            # Output quality checks, reported by output row number
+            row_number = len(transactions)
+            if len(description) < 5:
+                # Suspiciously short description (might indicate parsing issue)
+                print(f"  [WARNING] Row {row_number}: Very short description (may indicate parsing issue)")
+                short_description_count += 1
+            if debit_amount and credit_amount:
+                # Unusual for most transactions
+                print(f"  [WARNING] Row {row_number}: Has both debit and credit (verify this is correct)")
             
         except Exception as e:
             print(f"  [WARNING] Error parsing transaction {match.group(0)[:100]}... Error: {e}")
@@ -252,9 +388,235 @@ def parse_raiffeisen_pdf(text_content):
         if corrupted_count > 0:
             print(f"  [WARNING] {corrupted_count} transactions had corrupted descriptions")
     
+    if transactions and short_description_count == 0:
+        print(f"  [OK] Data quality check passed")
+    
     return transactions
 
 
+def read_csv_header(csvfile):
+    """
+    Advance an open Raiffeisen CSV file past its header line.
+    
+    The lines above the header ("No","Value Date", etc.) hold account
+    information. The header is located with byte searches over a memory map
+    of the file, so those lines are never decoded.
+    
+    Args:
+        csvfile: CSV file opened in text mode
+    
+    Returns:
+        List of column names
+    
+    Raises:
+        ValueError: If the file has no header line
+    """
+    if os.fstat(csvfile.fileno()).st_size > 0:
+        with mmap.mmap(csvfile.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            position = 0
+            while True:
+                index = mm.find(b'Value Date', position)
+                if index == -1:
+                    break
+                line_start = max(mm.rfind(b'\n', 0, index), mm.rfind(b'\r', 0, index)) + 1
+                line_end = mm.find(b'\n', index)
+                if line_end == -1:
+                    line_end = len(mm)
+                carriage_return = mm.find(b'\r', index, line_end)
+                if carriage_return != -1:
+                    line_end = carriage_return
+                line = mm[line_start:line_end]
+                if b'No' in line and b'Processing Date' in line:
+                    csvfile.seek(line_start)
+                    return next(csv.reader([csvfile.readline()]))
+                position = line_end
+    raise ValueError("Could not find header line in CSV file")
+
+
+def iter_raiffeisen_rows(rows, header):
+    """
+    Convert Raiffeisen CSV rows to transaction records one at a time.
+    
+    Args:
+        rows: Iterable of rows as lists of cells
+        header: Column names, in row order
+    
+    Yields:
+        Txn: One transaction per data row
+    """
+    # Resolve column positions once; a column missing from the header
+    # points at the empty cell appended to every row below
+    n_columns = len(header)
+    columns = {name: i for i, name in enumerate(header)}
+    i_number = columns.get('No', n_columns)
+    i_processing_date = columns.get('Processing Date', n_columns)
+    i_transaction_type = columns.get('Transaction Type', n_columns)
+    i_beneficiary = columns.get('Beneficairy/Ordering name and account number', n_columns)
+    i_description = columns.get('Description', n_columns)
+    i_reference = columns.get('Reference', n_columns)
+    i_amount = columns.get('Amount', n_columns)
+    i_balance = columns.get('Amount Total', n_columns)
+    
+    for row in rows:
+        if len(row) != n_columns:
+            row = (row + [''] * n_columns)[:n_columns]
+        row.append('')
+        
+        # Skip rows without processing date
+        processing_date = row[i_processing_date].strip()
+        if not processing_date:
+            continue
+        
+        # Skip summary rows
+        if 'Previous Balance' in row[i_number]:
+            continue
+        
+        # Extract and format data
+        transaction_type = row[i_transaction_type].strip()
+        beneficiary = row[i_beneficiary].strip()
+        description = row[i_description].strip()
+        reference = row[i_reference].strip()
+        amount = row[i_amount].strip()
+        balance = row[i_balance].strip()
+        
+        # Format date
+        formatted_date = format_date(processing_date)
+        
+        # Merge description fields
+        merged_description = merge_description(
+            transaction_type,
+            beneficiary,
+            description,
+            reference
+        )
+        
+        # Clean amounts
+        cleaned_amount = clean_amount(amount)
+        cleaned_balance = clean_amount(balance)
+        
+        yield Txn(formatted_date, merged_description, cleaned_amount, cleaned_balance)
+
+
+def iter_raiffeisen_csv(input_path):
+    """
+    Stream transactions from a Raiffeisen CSV file with the csv module.
+    
+    The file stays open while the caller iterates.
+    
+    Args:
+        input_path: Path to the CSV file
+    
+    Yields:
+        Txn: One transaction per data row
+    
+    Raises:
+        ValueError: If the file has no header line (on first iteration)
+    """
+    with open(input_path, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as csvfile:
+        header = read_csv_header(csvfile)
+        # The rest of the file is read straight from the same handle
+        yield from iter_raiffeisen_rows(csv.reader(csvfile), header)
+
+
+def parse_raiffeisen_csv_pandas(input_path):
+    """
+    Read transactions from a Raiffeisen CSV file with pandas' C parser.
+    
+    Only the columns used by the conversion are loaded, and dates and
+    amounts are converted column by column. Produces the same records as
+    iter_raiffeisen_csv (warnings are grouped by column instead of by row).
+    
+    Args:
+        input_path: Path to the CSV file
+    
+    Returns:
+        List of Txn records, or None if pandas could not parse
+        the file (the caller then uses iter_raiffeisen_csv)
+    
+    Raises:
+        ImportError: If pandas is not installed
+        ValueError: If the file has no header line
+    """
+    import pandas as pd  # Imported here so small files never pay for it
+    
+    with open(input_path, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as csvfile:
+        header = read_csv_header(csvfile)
+        try:
+            df = pd.read_csv(
+                csvfile,
+                header=None,
+                names=header,
+                usecols=[name for name in CSV_COLUMNS if name in header],
+                dtype=str,
+                keep_default_na=False,
+                index_col=False
+            )
+        except Exception as e:
+            # pandas is stricter than the csv module (e.g. ragged rows)
+            print(f"  [WARNING] pandas could not parse CSV ({e}), using the csv module")
+            return None
+    
+    df = df.fillna('')
+    
+    def column(name):
+        if name in df.columns:
+            return df[name]
+        return pd.Series('', index=df.index)
+    
+    # Skip rows without processing date and summary rows
+    processing_dates = column('Processing Date').str.strip()
+    keep = (processing_dates != '') & ~column('No').str.contains('Previous Balance', regex=False)
+    df = df[keep]
+    processing_dates = processing_dates[keep]
+    
+    # Parse each distinct date once; anything strptime-incompatible goes
+    # through format_date for its warning and fallback value
+    parsed_dates = pd.to_datetime(processing_dates, format='%d.%m.%Y', errors='coerce', cache=True)
+    formatted_dates = parsed_dates.dt.strftime('%m/%d/%Y').astype(object)
+    unparsed = parsed_dates.isna()
+    formatted_dates[unparsed] = processing_dates[unparsed].map(format_date)
+    
+    def amounts(name):
+        # Same cleanup as clean_amount, applied per column
+        values = column(name).str.strip()
+        cleaned = values.str.replace(CURRENCY_PATTERN.pattern, '', regex=True)
+        # Fixed-point amounts are reformatted as text (whole part without
+        # leading zeros, decimals padded to two). Everything else, including
+        # warnings, is left to clean_amount.
+        result = pd.Series('', index=values.index, dtype=object)
+        parts = cleaned.str.extract(f'^(?:{FIXED_POINT_PATTERN.pattern})$').fillna('')
+        numeric = cleaned.str.fullmatch(FIXED_POINT_PATTERN.pattern)
+        parts = parts[numeric]
+        result[numeric] = (
+            parts[0].where(parts[0] == '-', '')
+            + parts[1].str.lstrip('0').replace('', '0')
+            + '.'
+            + parts[2].str.ljust(2, '0')
+        )
+        other = ~numeric & (values != '')
+        result[other] = values[other].map(clean_amount)
+        return result
+    
+    cleaned_amounts = amounts('Amount')
+    cleaned_balances = amounts('Amount Total')
+    
+    merged_descriptions = map(
+        merge_description,
+        column('Transaction Type').str.strip().tolist(),
+        column('Beneficairy/Ordering name and account number').str.strip().tolist(),
+        column('Description').str.strip().tolist(),
+        column('Reference').str.strip().tolist()
+    )
+    
+    return list(map(
+        Txn,
+        formatted_dates.tolist(),
+        merged_descriptions,
+        cleaned_amounts.tolist(),
+        cleaned_balances.tolist()
+    ))
+
+
 def convert_raiffeisen_csv(input_csv, output_directory=None):
     """
     Convert Raiffeisen bank CSV to QBO format.
@@ -280,84 +642,60 @@ def convert_raiffeisen_csv(input_csv, output_directory=None):
     output_path = output_dir / output_filename
     
     # Check if output file exists and add version if needed
-    output_path = get_versioned_filename(output_path)
+    requested_path = output_path
+    output_path = get_versioned_filename(requested_path)
     
     print(f"Processing: {input_path.name}")
     
-    # Read input CSV - skip first 3 lines (empty line + account info + empty line)
-    transactions = []
+    # Read input CSV - account information lines come before the header
+    transactions = None
+    if input_path.stat().st_size > PANDAS_MIN_CSV_SIZE:
+        try:
+            transactions = parse_raiffeisen_csv_pandas(input_path)
+        except ImportError:
+            pass
+    if transactions is None:
+        # Stream rows straight into the output file
+        transactions = iter_raiffeisen_csv(input_path)
+    transactions = iter(transactions)
     
-    with open(input_path, 'r', encoding='utf-8') as csvfile:
-        # Read all lines
-        lines = csvfile.readlines()
-        
-        # Find the header line (contains "No","Value Date", etc.)
-        header_line_index = -1
-        for i, line in enumerate(lines):
-            if 'No' in line and 'Value Date' in line and 'Processing Date' in line:
-                header_line_index = i
-                break
-        
-        if header_line_index == -1:
-            raise ValueError("Could not find header line in CSV file")
-        
-        # Parse CSV starting from header line
-        from io import StringIO
-        csv_content = ''.join(lines[header_line_index:])
-        reader = csv.DictReader(StringIO(csv_content))
-        
-        for row in reader:
-            # Skip rows without processing date or with summary data
-            if not row.get('Processing Date') or row['Processing Date'].strip() == '':
-                continue
-            
-            # Skip summary rows
-            if 'Previous Balance' in str(row.get('No', '')):
-                continue
-            
-            # Extract and format data
-            processing_date = row.get('Processing Date', '').strip()
-            transaction_type = row.get('Transaction Type', '').strip()
-            beneficiary = row.get('Beneficairy/Ordering name and account number', '').strip()
-            description = row.get('Description', '').strip()
-            reference = row.get('Reference', '').strip()
-            amount = row.get('Amount', '').strip()
-            balance = row.get('Amount Total', '').strip()
-            
-            # Format date
-            formatted_date = format_date(processing_date)
-            
-            # Merge description fields
-            merged_description = merge_description(
-                transaction_type,
-                beneficiary,
-                description,
-                reference
-            )
-            
-            # Clean amounts
-            cleaned_amount = clean_amount(amount)
-            cleaned_balance = clean_amount(balance)
-            
-            # Create transaction record
-            transaction = {
-                'Date': formatted_date,
-                'Description': merged_description,
-                'Amount': cleaned_amount,
-                'Balance': cleaned_balance
-            }
-            
-            transactions.append(transaction)
+    # Read the first transaction up front so no file is created without any
+    first_transaction = next(transactions, None)
     
     # Write output CSV
-    if transactions:
-        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['Date', 'Description', 'Amount', 'Balance']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(transactions)
+    if first_transaction is not None:
+        # Claim the versioned filename; a parallel conversion of a file with
+        # the same name may have taken it since, in which case pick the next one
+        taken = set()
+        for _ in range(MAX_OUTPUT_NAME_ATTEMPTS):
+            try:
+                csvfile = open(output_path, 'x', newline='', encoding='utf-8')
+                break
+            except FileExistsError:
+                # Move past the name that collided even if the directory
+                # listing does not show it (dangling symlink, case folding)
+                taken.add(output_path.name)
+                output_path = get_versioned_filename(requested_path, taken)
+        else:
+            raise FileExistsError(f"No free output filename for {requested_path}")
+        
+        # zip stops on the transactions first, so the counter ends up one
+        # past the number of rows written
+        counter = count()
+        try:
+            with csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(Txn._fields)
+                writer.writerows(
+                    transaction for transaction, _ in
+                    zip(chain((first_transaction,), transactions), counter)
+                )
+        except Exception:
+            # Don't leave a half-written file behind when the input fails mid-way
+            output_path.unlink(missing_ok=True)
+            raise
         
-        print(f"  [OK] Converted {len(transactions)} transactions")
+        print(f"  [OK] Converted {next(counter)} transactions")
         print(f"  [OK] Saved to: {output_path}")
     else:
         print(f"  [WARNING] No transactions found in {input_path.name}")
@@ -374,32 +712,63 @@ def validate_balance_progression(transactions):
         Balance[n+1] = Balance[n] - Debit[n] + Credit[n]
     
     Args:
-        transactions: List of transaction dictionaries
+        transactions: List of PdfTxn records
+    
+    The order is inferred from the first pair of rows.
     
     Returns:
-        Tuple of (is_valid, errors_list, direction)
+        Tuple of (is_valid, errors_list, direction) with direction
+        "chronological" or "reverse_chronological"
     """
     if len(transactions) < 2:
         return True, [], "insufficient_data"
     
     errors = []
     
-    # Try to determine order by checking first few transactions
-    # Assume reverse chronological (newest first) which is common for bank statements
+    # Convert each balance once (every balance is compared twice); a balance
+    # that doesn't parse keeps its ValueError for the error report
+    balances = []
+    for trans in transactions:
+        try:
+            balances.append(float(str(trans.balance).replace(',', '')))
+        except ValueError as e:
+            balances.append(e)
+    
+    def amounts(trans):
+        debit = float(trans.debit) if trans.debit else 0
+        credit = float(trans.credit) if trans.credit else 0
+        return debit, credit
+    
+    # Determine the order from the first pair of readable balances: in
+    # chronological order the next row's amounts lead to its balance, in
+    # reverse order the current row's do. Reverse chronological (newest
+    # first) is common for bank statements, so it wins a tie.
+    direction = "reverse_chronological"
+    for i in range(len(transactions) - 1):
+        if not isinstance(balances[i], ValueError) and not isinstance(balances[i + 1], ValueError):
+            debit, credit = amounts(transactions[i])
+            reverse_difference = abs(balances[i] - debit + credit - balances[i + 1])
+            debit, credit = amounts(transactions[i + 1])
+            forward_difference = abs(balances[i] - debit + credit - balances[i + 1])
+            if forward_difference < reverse_difference:
+                direction = "chronological"
+            break
     
     for i in range(len(transactions) - 1):
         curr = transactions[i]
-        next_trans = transactions[i + 1]
+        curr_balance = balances[i]
+        next_balance = balances[i + 1]
         
         try:
-            curr_balance = float(str(curr['balance']).replace(',', ''))
-            next_balance = float(str(next_trans['balance']).replace(',', ''))
+            if isinstance(curr_balance, ValueError):
+                raise curr_balance
+            if isinstance(next_balance, ValueError):
+                raise next_balance
             
-            curr_debit = float(curr['debit']) if curr['debit'] else 0
-            curr_credit = float(curr['credit']) if curr['credit'] else 0
-            
-            # Calculate expected next balance
-            # If reverse chronological: next_balance = curr_balance - debit + credit
+            # Calculate expected next balance:
+            # next_balance = curr_balance - debit + credit, with the amounts
+            # of the next row (chronological) or the current one (reverse)
+            curr_debit, curr_credit = amounts(transactions[i + 1] if direction == "chronological" else curr)
             expected_next = curr_balance - curr_debit + curr_credit
             
             # Allow small floating point differences
@@ -408,7 +777,7 @@ def validate_balance_progression(transactions):
             if difference > 0.01:  # More than 1 cent difference
                 errors.append({
                     'row': i + 1,
-                    'date': curr['date'],
+                    'date': curr.date,
                     'current_balance': curr_balance,
                     'debit': curr_debit,
                     'credit': curr_credit,
@@ -417,13 +786,13 @@ def validate_balance_progression(transactions):
                     'difference': difference
                 })
         
-        except (ValueError, KeyError) as e:
+        except ValueError as e:
             errors.append({
                 'row': i + 1,
                 'error': f"Could not parse numbers: {e}"
             })
     
-    return len(errors) == 0, errors, "reverse_chronological"
+    return len(errors) == 0, errors, direction
 
 
 def convert_raiffeisen_pdf(input_pdf, output_directory=None):
@@ -468,53 +837,57 @@ def convert_raiffeisen_pdf(input_pdf, output_directory=None):
         print(f"  [WARNING] No transactions found in {input_path.name}")
         return None
     
-    print(f"  [INFO] Extracted {len(transactions)} transactions from PDF")
-    
     # Note: Balance validation temporarily disabled
     # The balance calculation logic varies by bank and transaction type
     
     # Write output CSV in QuickBooks format
     with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ['Date', 'Description', 'Debit', 'Credit', 'Balance']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for trans in transactions:
-            writer.writerow({
-                'Date': trans['date'],
-                'Description': trans['description'],
-                'Debit': f"{trans['debit']:.2f}" if trans['debit'] else '',
-                'Credit': f"{trans['credit']:.2f}" if trans['credit'] else '',
-                'Balance': trans['balance']
-            })
+        # Only the description can need quoting (dates and amounts come from
+        # digit-only captures), so the rows are formatted directly and
+        # written in one call
+        csvfile.write("Date,Description,Debit,Credit,Balance\r\n" + "".join(
+            f"{trans.date},{quote_csv_field(trans.description)},"
+            f"{f'{trans.debit:.2f}' if trans.debit else ''},"
+            f"{f'{trans.credit:.2f}' if trans.credit else ''},"
+            f"{trans.balance}\r\n"
+            for trans in transactions
+        ))
     
     print(f"  [OK] Converted {len(transactions)} transactions")
     
-    # Post-conversion validation
-    if len(transactions) > 0:
-        # Check for any remaining data quality issues
-        quality_issues = 0
-        for i, trans in enumerate(transactions, 1):
-            # Check if description is suspiciously short (might indicate parsing issue)
-            if len(trans['description']) < 5:
-                print(f"  [WARNING] Row {i}: Very short description (may indicate parsing issue)")
-                quality_issues += 1
-            
-            # Check if both debit and credit are present (unusual for most transactions)
-            if trans['debit'] and trans['credit']:
-                print(f"  [WARNING] Row {i}: Has both debit and credit (verify this is correct)")
-        
-        if quality_issues == 0:
-            print(f"  [OK] Data quality check passed")
-    
     print(f"  [OK] Saved to: {output_path}")
     
     return output_path
 
 
-def process_all_csv_files():
+def convert_csv_file(csv_file):
+    """
+    Convert one CSV file for process_all_csv_files, reporting errors instead of raising.
+    
+    Args:
+        csv_file: Path to the CSV file
+    
+    Returns:
+        True if the conversion succeeded
+    """
+    print(f"\n{'='*60}")
+    try:
+        convert_raiffeisen_csv(csv_file)
+        return True
+    except Exception as e:
+        print(f"  [ERROR] Error processing {csv_file.name}: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def process_all_csv_files(jobs=None):
     """
     Process all CSV files in current directory and import folder.
+    
+    Args:
+        jobs: Number of files to convert in parallel (1 = serial,
+            default: one per CPU)
     """
     search_paths = [Path('.'), Path('import')]
     csv_files = []
@@ -532,19 +905,18 @@ def process_all_csv_files():
         print(f"  - {csv_file.name}")
     print()
     
-    success_count = 0
-    failed_files = []
+    # Files are independent, so convert them in parallel unless told otherwise
+    jobs = jobs or min(len(csv_files), os.cpu_count() or 1)
+    if jobs > 1:
+        # Imported here: it pulls in multiprocessing, which single conversions never use
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(convert_csv_file, csv_files))
+    else:
+        results = list(map(convert_csv_file, csv_files))
     
-    for csv_file in csv_files:
-        print(f"\n{'='*60}")
-        try:
-            output_path = convert_raiffeisen_csv(csv_file)
-            success_count += 1
-        except Exception as e:
-            print(f"  [ERROR] Error processing {csv_file.name}: {e}")
-            failed_files.append(csv_file.name)
-            import traceback
-            traceback.print_exc()
+    success_count = sum(results)
+    failed_files = [csv_file.name for csv_file, ok in zip(csv_files, results) if not ok]
     
     # Print summary
     print(f"\n{'='*60}")
@@ -563,24 +935,78 @@ def process_all_csv_files():
         print(f"\n[SUCCESS] All converted files saved in the 'export' folder")
 
 
-if __name__ == "__main__":
-    import sys
+def parse_command_line(argv):
+    """
+    Read the input file and output directory from the command line.
+    
+    The plain "--input/-i FILE", "--output/-o DIR", "--jobs N", "--pymupdf"
+    and positional FILE forms are scanned directly, so the usual invocation
+    never imports argparse. Anything else (--help, --input=FILE, abbreviations,
+    mistakes) is handed to argparse, so its behaviour and messages are unchanged.
+    
+    Args:
+        argv: Command line arguments without the program name
+    
+    Returns:
+        Tuple of (input_file, output_dir, jobs, use_pymupdf); the first three
+        may be None
+    """
+    input_option = None
+    output_dir = None
+    positional = None
+    jobs = None
+    use_pymupdf = False
+    
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == '--pymupdf':
+            use_pymupdf = True
+            i += 1
+        elif arg == '--jobs':
+            if i + 1 >= len(argv) or not argv[i + 1].isdecimal():
+                break
+            jobs = int(argv[i + 1])
+            i += 2
+        elif arg in ('--input', '-i', '--output', '-o'):
+            if i + 1 >= len(argv) or argv[i + 1].startswith('-'):
+                break
+            if arg in ('--input', '-i'):
+                input_option = argv[i + 1]
+            else:
+                output_dir = argv[i + 1]
+            i += 2
+        elif not arg.startswith('-') and positional is None:
+            positional = arg
+            i += 1
+        else:
+            break
+    else:
+        # Support both --input flag and positional argument
+        return input_option or positional, output_dir, jobs, use_pymupdf
+    
     import argparse
     
-    # Parse command line arguments
     parser = argparse.ArgumentParser(description='Convert Raiffeisen bank statements to QuickBooks CSV format')
     parser.add_argument('--input', '-i', dest='input_file', help='Input CSV or PDF file path')
     parser.add_argument('--output', '-o', dest='output_dir', help='Output directory for CSV file')
     parser.add_argument('csv_file', nargs='?', help='CSV or PDF file path (positional argument)')
+    parser.add_argument('--jobs', type=int,
+                        help='Number of CSV files to convert in parallel when no input is given (1 = serial, default: one per CPU)')
+    parser.add_argument('--pymupdf', action='store_true',
+                        help='Extract PDF text with PyMuPDF instead of PyPDF2 (faster; must be installed)')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    return args.input_file or args.csv_file, args.output_dir, args.jobs, args.pymupdf
+
+
+if __name__ == "__main__":
+    import sys
     
-    # Determine input file (support both --input flag and positional argument)
-    input_file = None
-    if args.input_file:
-        input_file = args.input_file
-    elif args.csv_file:
-        input_file = args.csv_file
+    # Parse command line arguments
+    input_file, output_dir, jobs, use_pymupdf = parse_command_line(sys.argv[1:])
+    if use_pymupdf:
+        os.environ[PYMUPDF_ENV_VAR] = '1'
     
     # Check if a specific file path is provided
     if input_file:
@@ -589,9 +1015,9 @@ if __name__ == "__main__":
             
             # Detect file type and use appropriate converter
             if input_path.suffix.lower() == '.pdf':
-                result_path = convert_raiffeisen_pdf(input_file, args.output_dir)
+                result_path = convert_raiffeisen_pdf(input_file, output_dir)
             elif input_path.suffix.lower() == '.csv':
-                result_path = convert_raiffeisen_csv(input_file, args.output_dir)
+                result_path = convert_raiffeisen_csv(input_file, output_dir)
             else:
                 print(f"\n[ERROR] Unsupported file type: {input_path.suffix}")
                 print("Supported formats: .pdf, .csv")
@@ -608,4 +1034,4 @@ if __name__ == "__main__":
             sys.exit(1)
     else:
         # Process all CSV files in the current directory
-        process_all_csv_files()
+        process_all_csv_files(jobs)
@@ -3,12 +3,63 @@ TABANK PDF to QBO Format Converter
 Converts TABANK (Tirana Bank) PDF statements to QBO-compatible CSV format.
 """
 
-import PyPDF2
 import csv
+import os
 import re
 from pathlib import Path
 import sys
 from datetime import datetime
+from functools import lru_cache
+
+
+# Buffer size for writing the output CSV file (1 MB)
+IO_BUFFER_SIZE = 1 << 20
+
+# PyPDF2 is the default PDF library; setting this variable (done by --pymupdf)
+# opts in to PyMuPDF
+PYMUPDF_ENV_VAR = 'QBO_USE_PYMUPDF'
+
+# Transaction line: starts with time HH:MM followed by the two dates
+# Format: "07:51   01 Kor 25 01 Kor 25 DESCRIPTION -amount  balance"
+# or:     "14:40   04 Kor 25 04 Kor 25 DESCRIPTION amount  balance"
+TRANSACTION_PATTERN = re.compile(r'^\d{2}:\d{2}\s+(\d{2}\s+\w{3}\s+\d{2})\s+\d{2}\s+\w{3}\s+\d{2}\s+')
+
+# Amount followed by balance at the end of the line; the amount is a debit
+# when it has a minus sign (group 1) and a credit otherwise
+AMOUNT_BALANCE_PATTERN = re.compile(r'(-?)(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s+(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*$')
+
+# Albanian and English month abbreviations (lowercase) mapping to month numbers
+MONTH_NUMBERS = {
+    # Albanian
+    'jan': '01', 'shk': '02', 'mar': '03', 'pri': '04', 'maj': '05', 'qer': '06',
+    'kor': '07', 'gus': '08', 'sht': '09', 'tet': '10', 'nën': '11', 'nen': '11', 'dhj': '12',
+    # English
+    'feb': '02', 'apr': '04', 'may': '05', 'jun': '06',
+    'jul': '07', 'aug': '08', 'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
+}
+
+# Numeric date formats tried in order by format_date, with their separator
+NUMERIC_DATE_FORMATS = [
+    ('/', '%d/%m/%Y'),
+    ('.', '%d.%m.%Y'),
+    ('-', '%d-%m-%Y'),
+    ('/', '%d/%m/%y'),
+    ('.', '%d.%m.%y'),
+    ('-', '%d-%m-%y'),
+    ('-', '%Y-%m-%d')
+]
+
+# Header/footer and balance summary text that ends a transaction's description
+STATEMENT_TEXT_PATTERN = re.compile('|'.join(map(re.escape, [
+    'Numri i llogarisë', 'Data e Veprimit', 'Datë Valuta', 'Përshkrimi',
+    'Debi', 'Kredi', 'Balance', 'Nxjerrje Llogarie', 'Faqe :',
+    'Teprica e mbartur', 'Teprica që do te mbartet',
+    'Shënim:', 'Data e printimit', 'Nga :', 'Deri :', 'Printuar për',
+    'Monedha:', 'Adresa :', 'Tel:', 'Status', 'nga'
+])))
+
+# Statement date: "01 Kor 25"
+STATEMENT_DATE_PATTERN = re.compile(r'(\d{2})\s+(\w{3})\s+(\d{2})')
 
 
 def get_versioned_filename(file_path):
@@ -40,29 +91,79 @@ def get_versioned_filename(file_path):
         version += 1
 
 
+@lru_cache(maxsize=None)
+def get_pdf_backend():
+    """
+    Import the PDF library on first use.
+    
+    PyPDF2 is the default. PyMuPDF (C-backed text extraction) is used
+    instead when opted in through PYMUPDF_ENV_VAR and installed.
+    
+    Returns:
+        tuple: (name, module) with name 'pymupdf' or 'pypdf2', or None if
+        no usable library can be imported
+    """
+    if os.environ.get(PYMUPDF_ENV_VAR):
+        try:
+            import pymupdf as fitz
+            return 'pymupdf', fitz
+        except ImportError:
+            pass
+        try:
+            import fitz  # PyMuPDF releases before the pymupdf module name
+            return 'pymupdf', fitz
+        except ImportError:
+            print("Warning: PyMuPDF not installed, using PyPDF2")
+    try:
+        import PyPDF2
+        return 'pypdf2', PyPDF2
+    except ImportError:
+        return None
+
+
 def extract_text_from_pdf(pdf_path):
     """
     Extract text content from PDF file.
     
+    Uses PyPDF2, or PyMuPDF when opted in with --pymupdf.
+    
     Args:
         pdf_path: Path to the PDF file
     
     Returns:
         String containing all text from the PDF
+    
+    Raises:
+        ImportError: If the selected PDF library is not installed
     """
+    backend = get_pdf_backend()
+    if backend is None:
+        raise ImportError("PDF support not available. Install PyPDF2 (or PyMuPDF and pass --pymupdf) to process PDF files.")
+    name, module = backend
+    
     text_content = []
     
-    with open(pdf_path, 'rb') as pdf_file:
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        num_pages = len(pdf_reader.pages)
-        print(f"Reading PDF: {pdf_path}")
-        print(f"Total pages: {num_pages}")
-        
-        for page_num in range(num_pages):
-            print(f"Processing page {page_num + 1}/{num_pages}...", end='\r')
-            page = pdf_reader.pages[page_num]
-            text = page.extract_text()
-            text_content.append(text)
+    if name == 'pymupdf':
+        with module.open(pdf_path) as doc:
+            num_pages = doc.page_count
+            print(f"Reading PDF: {pdf_path}")
+            print(f"Total pages: {num_pages}")
+            
+            for page_num, page in enumerate(doc):
+                print(f"Processing page {page_num + 1}/{num_pages}...", end='\r')
+                text_content.append(page.get_text("text"))
+    else:
+        with open(pdf_path, 'rb') as pdf_file:
+            pdf_reader = module.PdfReader(pdf_file)
+            num_pages = len(pdf_reader.pages)
+            print(f"Reading PDF: {pdf_path}")
+            print(f"Total pages: {num_pages}")
+            
+            for page_num in range(num_pages):
+                print(f"Processing page {page_num + 1}/{num_pages}...", end='\r')
+                page = pdf_reader.pages[page_num]
+                text = page.extract_text()
+                text_content.append(text)
     
     print(f"\nText extraction completed!")
     return '\n'.join(text_content)
@@ -81,17 +182,13 @@ def parse_tabank_statement(text_content):
     transactions = []
     lines = text_content.split('\n')
     
-    # Transaction line pattern: starts with time HH:MM followed by date
-    # Format: "07:51   01 Kor 25 01 Kor 25 DESCRIPTION -amount  balance"
-    # or:     "14:40   04 Kor 25 04 Kor 25 DESCRIPTION amount  balance"
-    transaction_pattern = r'^\d{2}:\d{2}\s+(\d{2}\s+\w{3}\s+\d{2})\s+\d{2}\s+\w{3}\s+\d{2}\s+'
-    
     i = 0
     while i < len(lines):
         line = lines[i].strip()
         
-        # Check if this line starts a transaction
-        match = re.match(transaction_pattern, line)
+        # Check if this line starts a transaction (only lines with the
+        # time's colon in third place can, so the rest skip the regex)
+        match = TRANSACTION_PATTERN.match(line) if line[2:3] == ':' else None
         
         if match:
             # Extract date (from first date column, ignore time)
@@ -110,24 +207,18 @@ def parse_tabank_statement(text_content):
             balance = ''
             description_text = rest_of_line
             
-            # Look for negative amount (debit) followed by balance
-            debit_pattern = r'-(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s+(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*$'
-            debit_match = re.search(debit_pattern, rest_of_line)
+            # Look for the amount followed by balance; a minus sign makes it a debit
+            amount_match = AMOUNT_BALANCE_PATTERN.search(rest_of_line)
             
-            if debit_match:
-                # This is a debit transaction
-                debit = debit_match.group(1).replace(',', '')
-                balance = debit_match.group(2).replace(',', '')
-                description_text = rest_of_line[:debit_match.start()].strip()
-            else:
-                # Look for credit (positive amount) followed by balance
-                credit_pattern = r'(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s+(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*$'
-                credit_match = re.search(credit_pattern, rest_of_line)
-                
-                if credit_match:
-                    credit = credit_match.group(1).replace(',', '')
-                    balance = credit_match.group(2).replace(',', '')
-                    description_text = rest_of_line[:credit_match.start()].strip()
+            if amount_match:
+                amount = amount_match.group(2).replace(',', '')
+                if amount_match.group(1):
+                    # This is a debit transaction
+                    debit = amount
+                else:
+                    credit = amount
+                balance = amount_match.group(3).replace(',', '')
+                description_text = rest_of_line[:amount_match.start()].strip()
             
             # Collect all description lines until next transaction
             details = [description_text] if description_text else []
@@ -138,7 +229,7 @@ def parse_tabank_statement(text_content):
                 next_line = lines[j].strip()
                 
                 # Stop if we hit another transaction (starts with time)
-                if re.match(transaction_pattern, next_line):
+                if next_line[2:3] == ':' and TRANSACTION_PATTERN.match(next_line):
                     break
                 
                 # Stop if empty line
@@ -147,13 +238,7 @@ def parse_tabank_statement(text_content):
                     continue
                 
                 # Skip header/footer lines and balance summary lines
-                if any(skip in next_line for skip in [
-                    'Numri i llogarisë', 'Data e Veprimit', 'Datë Valuta', 'Përshkrimi',
-                    'Debi', 'Kredi', 'Balance', 'Nxjerrje Llogarie', 'Faqe :',
-                    'Teprica e mbartur', 'Teprica që do te mbartet',
-                    'Shënim:', 'Data e printimit', 'Nga :', 'Deri :', 'Printuar për',
-                    'Monedha:', 'Adresa :', 'Tel:', 'Status', 'nga'
-                ]):
+                if STATEMENT_TEXT_PATTERN.search(next_line):
                     break
                 
                 # Add this line to description
@@ -180,6 +265,7 @@ def parse_tabank_statement(text_content):
     return transactions
 
 
+@lru_cache(maxsize=4096)
 def format_date(date_str):
     """
     Convert various date formats to MM/DD/YYYY format.
@@ -192,20 +278,8 @@ def format_date(date_str):
     Returns:
         Date string in MM/DD/YYYY format (e.g., 07/05/2025)
     """
-    # Albanian month abbreviations mapping to month numbers
-    albanian_months = {
-        'Jan': '01', 'Shk': '02', 'Mar': '03', 'Pri': '04', 'Maj': '05', 'Qer': '06',
-        'Kor': '07', 'Gus': '08', 'Sht': '09', 'Tet': '10', 'Nën': '11', 'Nen': '11', 'Dhj': '12'
-    }
-    
-    # English month abbreviations mapping to month numbers
-    english_months = {
-        'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04', 'May': '05', 'Jun': '06',
-        'Jul': '07', 'Aug': '08', 'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
-    }
-    
     # Try Albanian/English format: "01 Kor 25" -> "07/01/2025"
-    alb_match = re.match(r'(\d{2})\s+(\w{3})\s+(\d{2})', date_str)
+    alb_match = STATEMENT_DATE_PATTERN.match(date_str)
     if alb_match:
         day = alb_match.group(1)
         month_abbr = alb_match.group(2)
@@ -214,26 +288,16 @@ def format_date(date_str):
         # Convert 2-digit year to 4-digit (assume 20xx)
         full_year = f"20{year}"
         
-        # Check Albanian months
-        if month_abbr in albanian_months:
-            return f"{albanian_months[month_abbr]}/{day}/{full_year}"
-        
-        # Check English months
-        if month_abbr in english_months:
-            return f"{english_months[month_abbr]}/{day}/{full_year}"
-    
-    # Try different numeric date formats
-    date_formats = [
-        '%d/%m/%Y',
-        '%d.%m.%Y',
-        '%d-%m-%Y',
-        '%d/%m/%y',
-        '%d.%m.%y',
-        '%d-%m-%y',
-        '%Y-%m-%d'
-    ]
-    
-    for in_fmt in date_formats:
+        # Check Albanian and English months (any letter case)
+        month = MONTH_NUMBERS.get(month_abbr.lower())
+        if month:
+            return f"{month}/{day}/{full_year}"
+    
+    # Try different numeric date formats, skipping those whose separator
+    # isn't in the string (strptime can't match them)
+    for separator, in_fmt in NUMERIC_DATE_FORMATS:
+        if separator not in date_str:
+            continue
         try:
             date_obj = datetime.strptime(date_str, in_fmt)
             # If year is 2-digit, ensure it's in 2000s
@@ -247,6 +311,24 @@ def format_date(date_str):
     return date_str
 
 
+def parse_amount(value):
+    """
+    Convert an amount field to float for the balance check.
+    
+    Args:
+        value: Amount string (commas already removed), '' for none
+    
+    Returns:
+        float value, 0 for an empty field, or None if it isn't a number
+    """
+    if not value:
+        return 0
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
 def validate_and_fix_transactions(transactions):
     """
     Validate transactions by checking if balance calculations are correct.
@@ -260,22 +342,22 @@ def validate_and_fix_transactions(transactions):
     """
     corrections_made = 0
     
-    for i in range(len(transactions)):
-        # Skip first transaction (no previous balance to compare)
-        if i == 0:
-            continue
-        
+    # Each balance is compared twice (as current and as previous balance),
+    # so convert them all once up front
+    balances = [parse_amount(transaction['Balance']) for transaction in transactions]
+    
+    # Skip first transaction (no previous balance to compare)
+    for i in range(1, len(transactions)):
         current = transactions[i]
-        previous = transactions[i - 1]
         
         # Get values, default to 0 if empty
-        try:
-            prev_balance = float(previous['Balance']) if previous['Balance'] else 0
-            current_balance = float(current['Balance']) if current['Balance'] else 0
-            debit = float(current['Debit']) if current['Debit'] else 0
-            credit = float(current['Credit']) if current['Credit'] else 0
-        except (ValueError, TypeError):
-            # Skip if values can't be converted to float
+        prev_balance = balances[i - 1]
+        current_balance = balances[i]
+        debit = parse_amount(current['Debit'])
+        credit = parse_amount(current['Credit'])
+        
+        # Skip if values can't be converted to float
+        if prev_balance is None or current_balance is None or debit is None or credit is None:
             continue
         
         # Calculate expected balance: previous_balance - debit + credit
@@ -290,7 +372,7 @@ def validate_and_fix_transactions(transactions):
                 # Swap debit and credit
                 current['Debit'], current['Credit'] = current['Credit'], current['Debit']
                 corrections_made += 1
-                print(f"  WARNING: Row {i+1}: Swapped debit/credit for '{current['Date']}' - {current['Description'][:30]}...", flush=True)
+                print(f"  WARNING: Row {i+1}: Swapped debit/credit for '{current['Date']}' - {current['Description'][:30]}...")
     
     return transactions, corrections_made
 
@@ -361,11 +443,6 @@ def pdf_to_csv(pdf_path, output_csv=None):
                (not first_row.get('Credit') or first_row['Credit'] == ''):
                 print(f"Removed first row (opening balance only)", flush=True)
                 transactions = transactions[1:]
-        
-        # Remove Balance column from all transactions
-        for transaction in transactions:
-            if 'Balance' in transaction:
-                del transaction['Balance']
     
     # Check if output file exists and add version if needed
     output_csv = get_versioned_filename(output_csv)
@@ -374,12 +451,14 @@ def pdf_to_csv(pdf_path, output_csv=None):
     if transactions:
         print(f"\nWriting {len(transactions)} transactions to CSV...", flush=True)
         
-        fieldnames = ['Date', 'Description', 'Debit', 'Credit']
-        
-        with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(transactions)
+        with open(output_csv, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['Date', 'Description', 'Debit', 'Credit'])
+            # The Balance column is only used for validation and isn't written
+            writer.writerows(
+                (t['Date'], t['Description'], t['Debit'], t['Credit'])
+                for t in transactions
+            )
         
         print(f"CSV file saved: {output_csv}", flush=True)
         print(f"Success! {len(transactions)} transactions exported.", flush=True)
@@ -398,9 +477,14 @@ if __name__ == "__main__":
     parser.add_argument('--output', '-o', dest='output_dir', help='Output directory for CSV file')
     parser.add_argument('pdf_file', nargs='?', help='PDF file path (positional argument)')
     parser.add_argument('output_file', nargs='?', help='Output file path (positional argument)')
+    parser.add_argument('--pymupdf', action='store_true',
+                        help='Extract PDF text with PyMuPDF instead of PyPDF2 (faster; must be installed)')
     
     args = parser.parse_args()
     
+    if args.pymupdf:
+        os.environ[PYMUPDF_ENV_VAR] = '1'
+    
     # Determine input file (support both --input flag and positional argument)
     input_pdf = None
     if args.input_file:
@@ -489,7 +573,7 @@ if __name__ == "__main__":
         if failed_files:
             print("\nFailed files:", flush=True)
             for filename in failed_files:
-                print(f"  - {filename}", flush=True)
+                print(f"  - {filename}")
         
         if success_count > 0:
             print(f"\nAll CSV files saved in the 'export' folder", flush=True)